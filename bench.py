@@ -0,0 +1,437 @@
+"""Прості заміри продуктивності.
+
+Запуск:  python bench.py [startup] [import] [render] [scroll] [zoom] [mining] [telemetry] [net] [lighting] [contacts] [particles]
+"""
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from forager import assets
+from build_atlas import ATLAS_SPRITES
+
+
+def _count_opens(fn):
+    """Викликає fn() і рахує звернення до файлів (open + pygame.image.load)."""
+    import builtins
+    opened = [0]
+    real_open, real_load = builtins.open, pygame.image.load
+
+    def counting_open(*args, **kwargs):
+        opened[0] += 1
+        return real_open(*args, **kwargs)
+
+    def counting_load(*args, **kwargs):
+        opened[0] += 1
+        return real_load(*args, **kwargs)
+
+    builtins.open, pygame.image.load = counting_open, counting_load
+    try:
+        fn()
+    finally:
+        builtins.open, pygame.image.load = real_open, real_load
+    return opened[0]
+
+
+def bench_startup(repeats=5):
+    """Холодне завантаження всіх спрайтів: окремі PNG проти атласу."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    def load_all():
+        for path, size in ATLAS_SPRITES:
+            assets.safe_load_image(path, size)
+
+    results = {}
+    for label, use_atlas in (("loose", False), ("atlas", True)):
+        best = float("inf")
+        for _ in range(repeats):
+            assets.clear_cache()
+            if not use_atlas:
+                assets._atlas = False  # вимикаємо атлас для цього заміру
+            t0 = time.perf_counter()
+            load_all()
+            best = min(best, time.perf_counter() - t0)
+        assets.clear_cache()
+        if not use_atlas:
+            assets._atlas = False
+        results[label] = (best, _count_opens(load_all))
+
+    if not os.path.exists(assets.ATLAS_IMAGE):
+        print("atlas.png не знайдено — спершу запустіть build_atlas.py")
+    for label, (seconds, opens) in results.items():
+        print(f"{label:6s} {seconds * 1000:8.2f} ms  файлів відкрито: {opens}")
+    return results
+
+
+IMPORT_STAGES = (
+    ("import pygame", "import pygame"),
+    ("import forager.game", "from forager import game"),
+    ("+ reset_game_state", "from forager import game; game.reset_game_state()"),
+    ("+ перший кадр", "import pygame; from forager import game; game.reset_game_state(); "
+                      "game.draw_game(pygame.Surface((game.WIDTH, game.HEIGHT)))"),
+)
+
+
+def bench_import(repeats=3):
+    """Холодний старт у свіжому інтерпретаторі: скільки коштує кожен наступний крок."""
+    import subprocess
+    root = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for label, code in IMPORT_STAGES:
+        timed = ("import time; t0 = time.perf_counter(); " + code +
+                 "; print(time.perf_counter() - t0)")
+        best = float("inf")
+        for _ in range(repeats):
+            out = subprocess.run([sys.executable, "-c", timed], cwd=root, capture_output=True,
+                                 text=True, check=True, env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"))
+            best = min(best, float(out.stdout.split()[-1]))
+        results[label] = best
+        print(f"{label:22s} {best * 1000:8.1f} ms")
+    return results
+
+
+def bench_render(frames=300, seed=7):
+    """Кадр гри: програмний бліт проти текстур SDL Renderer (програмний рендерер)."""
+    from forager import game
+    game.configure(seed=seed)
+    from forager.render_backend import TextureBackend
+
+    game.reset_game_state()
+    game.update_game(game.TICK_MS)
+    backends = [game.display()]
+    try:
+        backends.append(TextureBackend((game.WIDTH, game.HEIGHT), "bench", accelerated=0))
+    except Exception as exc:  # немає pygame._sdl2 або рендерера
+        print(f"sdl2: недоступний ({exc})")
+
+    results = {}
+    for gfx in backends:
+        for warmup in range(10):
+            game.draw_game(gfx, gfx.hud_surface())
+            gfx.present()
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            game.update_game(game.TICK_MS)
+            game.draw_game(gfx, gfx.hud_surface())
+            gfx.present()
+        per_frame = (time.perf_counter() - t0) / frames
+        results[gfx.name] = per_frame
+        print(f"{gfx.name:8s} {per_frame * 1000:7.3f} ms/кадр  ({game.world.count('sprite')} спрайтів у світі)")
+    return results
+
+
+def bench_net(ticks=300, seed=7, enemies=40, clients=(1, 2, 4, 8, 16, 32)):
+    """Навантаження сервера: трафік на клієнта і час тіку для 1..32 клієнтів."""
+    from forager import game, net
+    game.configure(seed=seed)
+
+    results = {}
+    print(f"{'клієнтів':>8s} {'тік, мс':>8s} {'з них мережа':>12s} {'Б/тік/клієнт':>13s} {'КіБ/с/клієнт':>13s}")
+    for count in clients:
+        game.reset_game_state()
+        for _ in range(enemies):
+            game.spawn_enemy()
+        server = net.GameServer(game.update_game, game.net_snapshot, port=0)
+        conns = [net.SnapshotClient(server.address, server.tick_ms) for _ in range(count)]
+        server.tick()  # приймає підключення і шле повні знімки
+        for conn in conns:
+            while not conn.tick:
+                conn.poll()
+        received = [conn.bytes_received for conn in conns]
+        server.sim_seconds = server.net_seconds = 0.0
+        for _ in range(ticks):
+            server.tick()
+            for conn in conns:
+                conn.poll()
+        # довантажуємо те, що ще в дорозі
+        while any(conn.tick != server.tick_no for conn in conns):
+            for conn in conns:
+                conn.poll()
+
+        per_tick = (server.sim_seconds + server.net_seconds) / ticks * 1000
+        net_ms = server.net_seconds / ticks * 1000
+        per_client = sum(c.bytes_received - r for c, r in zip(conns, received)) / count / ticks
+        kib_s = per_client * (1000 / server.tick_ms) / 1024
+        results[count] = (per_tick, net_ms, per_client)
+        print(f"{count:8d} {per_tick:8.3f} {net_ms:12.3f} {per_client:13.1f} {kib_s:13.2f}")
+        for conn in conns:
+            conn.close()
+        server.close()
+    print(f"(сутностей у світі: {len(game.world)}, тік {1000 / server.tick_ms:.0f} Гц)")
+    return results
+
+
+def bench_scroll(frames=600, seed=7, world=3000, radius=600):
+    """Безперервна ходьба: статичний шар з повторним використанням проти повного перемалу."""
+    from forager import game
+    game.configure(world=world, seed=seed)
+    game.reset_game_state()
+    gfx = game.display()
+    layer = game.static_layer
+    full_px = game.WIDTH * game.HEIGHT
+    cx, cy = world // 2, world // 2
+
+    results = {}
+    for enabled in (False, True):
+        layer.enabled = enabled
+        painted = 0
+        t0 = time.perf_counter()
+        for i in range(frames):
+            # гравець іде по колу зі швидкістю player.speed px за кадр
+            angle = i * game.player.speed / radius
+            game.player.rect.center = (cx + int(radius * math.cos(angle)), cy + int(radius * math.sin(angle)))
+            game.draw_game(gfx, gfx.hud_surface())
+            painted += layer.painted if enabled else full_px
+        per_frame = (time.perf_counter() - t0) / frames
+        label = "scroll" if enabled else "full"
+        results[label] = (per_frame, painted / frames)
+        print(f"{label:6s} {per_frame * 1000:7.3f} ms/кадр  статичного перемальовано "
+              f"{painted / frames:9.0f} px/кадр ({100 * painted / frames / full_px:5.1f}% екрана)")
+    layer.enabled = True
+    print(f"({game.world.count('collider')} стін і блоків у світі)")
+    return results
+
+
+def _count_scales(fn):
+    """Викликає fn() і рахує виклики pygame.transform.scale/smoothscale."""
+    calls = [0]
+    real_scale, real_smooth = pygame.transform.scale, pygame.transform.smoothscale
+
+    def counting(real):
+        def scale(*args, **kwargs):
+            calls[0] += 1
+            return real(*args, **kwargs)
+        return scale
+
+    pygame.transform.scale, pygame.transform.smoothscale = counting(real_scale), counting(real_smooth)
+    try:
+        fn()
+    finally:
+        pygame.transform.scale, pygame.transform.smoothscale = real_scale, real_smooth
+    return calls[0]
+
+
+def bench_zoom(frames=300, seed=7, world=3000, radius=600):
+    """Ходьба на кожному рівні зуму: час кадру і масштабування спрайтів після прогріву."""
+    from forager import game
+    from forager.mipmaps import MipCache
+    game.configure(world=world, seed=seed)
+    game.reset_game_state()
+    gfx = game.display()
+    camera = game.camera
+    cx, cy = world // 2, world // 2
+
+    def walk(count):
+        for i in range(count):
+            angle = i * game.player.speed / radius
+            game.player.rect.center = (cx + int(radius * math.cos(angle)), cy + int(radius * math.sin(angle)))
+            game.draw_game(gfx, gfx.hud_surface())
+
+    results = {}
+    cached = camera.cache
+    for label, cache in (("кеш", cached), ("без кешу", MipCache(max_bytes=0))):
+        camera.cache = cache
+        for level, zoom in enumerate(camera.levels):
+            camera.level = level
+            walk(frames // 10)  # прогрів: шар, світло, копії спрайтів
+            t0 = time.perf_counter()
+            scales = _count_scales(lambda: walk(frames))
+            per_frame = (time.perf_counter() - t0) / frames
+            results[(label, zoom)] = per_frame
+            print(f"{label:8s} зум {zoom:4.2f}: {per_frame * 1000:7.3f} ms/кадр  "
+                  f"масштабувань {scales / frames:6.1f}/кадр")
+    camera.cache = cached
+    camera.reset_zoom()
+    print(f"кеш: {len(cached)} копій, {cached.bytes / 1024:.0f} KiB (ліміт {cached.max_bytes // 1048576} MiB), "
+          f"влучань {cached.hits}, промахів {cached.misses}, викинуто {cached.evictions}")
+    return results
+
+
+def bench_mining(seed=7, world=3000, radius=1000):
+    """Удар по площі: пакетне ламання проти поблочного, разом з наступним кадром."""
+    from forager import game
+    game.configure(world=world, seed=seed)
+    gfx = game.display()
+
+    def area():
+        # усі добувні блоки в колі навколо гравця — як бур з великим радіусом
+        cx, cy = game.player.rect.center
+        reach = pygame.Rect(cx - radius, cy - radius, 2 * radius, 2 * radius)
+        found = [obj for obj in game.obstacles.query_rect(reach)
+                 if game.is_minable(obj) and math.dist(obj.rect.center, (cx, cy)) <= radius]
+        found.sort(key=game.static_order)
+        return [(obj.entity, obj) for obj in found]
+
+    results = {}
+    for label in ("per_block", "batch"):
+        game.reset_game_state()
+        game.draw_game(gfx, gfx.hud_surface())
+        targets = area()
+        t0 = time.perf_counter()
+        if label == "batch":
+            game.break_blocks(targets)
+        else:
+            for target in targets:
+                game.break_blocks([target])
+        broke = time.perf_counter() - t0
+        game.draw_game(gfx, gfx.hud_surface())  # статичний шар перемальовує зачеплене
+        total = time.perf_counter() - t0
+        results[label] = total
+        print(f"{label:9s} {len(targets)} блоків: ламання {broke * 1000:7.2f} ms, "
+              f"з кадром {total * 1000:7.2f} ms, частинок {len(game.particles)}")
+    return results
+
+
+def bench_lighting(frames=300, seed=7):
+    """Ціна шару світла: кадр з ним і без, окремо — перерахунок тайлів."""
+    from forager import game
+    game.configure(seed=seed)
+
+    game.reset_game_state()
+    lights = game.lights
+    gfx = game.display()
+    results = {}
+    for enabled in (False, True):
+        lights.enabled = enabled
+        t0 = time.perf_counter()
+        for i in range(frames):
+            # гравець ходить по колу, тож світло і камера постійно зсуваються
+            game.player.rect.center = (500 + int(150 * math.cos(i / 20)), 500 + int(150 * math.sin(i / 20)))
+            game.update_game(game.TICK_MS)
+            game.draw_game(gfx, gfx.hud_surface())
+        per_frame = (time.perf_counter() - t0) / frames
+        results["on" if enabled else "off"] = per_frame
+        print(f"світло {'увімк' if enabled else 'вимк'}: {per_frame * 1000:7.3f} ms/кадр")
+
+    t0 = time.perf_counter()
+    for i in range(frames):
+        lights.set_source("player", (i % 40) * lights.tile, 500, game.PLAYER_LIGHT_RADIUS)
+    relight = (time.perf_counter() - t0) / frames
+    results["relight"] = relight
+    print(f"перехід джерела в інший тайл: {relight * 1000:7.3f} ms ({game.world.count('sprite')} спрайтів у світі)")
+    return results
+
+
+def bench_contacts(ticks=200, bodies=40, statics=(500, 5000)):
+    """Ціна кроку контактів: залежить від рухомих тіл, а не від кількості блоків."""
+    import random
+    from forager.contacts import ContactSystem
+
+    results = {}
+    for count in statics:
+        rng = random.Random(1)
+        system = ContactSystem(64)
+        system.on("player", "enemy")
+        system.on("enemy", "block")
+        side = int((count * 2500) ** 0.5)  # щільність як у згенерованому світі
+        for i in range(count):
+            system.add_static(bodies + 1 + i, "block", pygame.Rect(rng.randrange(side), rng.randrange(side), 50, 50))
+        movers = [pygame.Rect(rng.randrange(side), rng.randrange(side), 30, 30) for _ in range(bodies)]
+        player = pygame.Rect(side // 2, side // 2, 30, 30)
+        t0 = time.perf_counter()
+        contacts = 0
+        for tick in range(ticks):
+            for rect in movers:
+                rect.move_ip(rng.choice((-2, 2)), rng.choice((-2, 2)))
+            system.step([(0, player, "player")] + [(i + 1, r, "enemy") for i, r in enumerate(movers)])
+            contacts += len(system.contacts)
+        per_tick = (time.perf_counter() - t0) / ticks
+        results[count] = per_tick
+        print(f"{count:6d} блоків, {bodies} рухомих: {per_tick * 1000:7.3f} ms/тік, "
+              f"~{contacts / ticks:.0f} контактів")
+    return results
+
+
+def bench_particles(frames=200, live=(1000, 10000, 30000)):
+    """Тік і малювання пулу частинок при сталій кількості живих."""
+    import tracemalloc
+    from forager.particles import ParticleSystem
+
+    screen = pygame.display.set_mode((600, 600))
+    results = {}
+    for count in live:
+        system = ParticleSystem(capacity=count * 2)
+        per_frame = count // 47  # життя в середньому ~47 кадрів, тож поповнюємо стільки ж
+        system.emit(300, 300, count, (255, 200, 0), speed=0.2, life_ms=1000)
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            system.emit(300, 300, per_frame, (255, 200, 0), speed=0.2, life_ms=1000)
+            system.update(16)
+            system.draw(screen, 0, 0)
+        elapsed = (time.perf_counter() - t0) / frames
+        grown = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results[count] = elapsed
+        print(f"{len(system):6d} живих: {elapsed * 1000:7.3f} ms/кадр (тік + малювання), "
+              f"пам'ять після циклу {grown / 1024:+.1f} KiB")
+    return results
+
+
+def bench_telemetry(events=200000, burst=50000):
+    """Ціна record() з працюючим потоком запису; відкидання при сплеску; ротація файлів."""
+    import glob
+    import tempfile
+    from forager.telemetry import Telemetry
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        # буфер вміщує всі події: міряємо сам record() і окремо — як швидко пише потік
+        tele = Telemetry(capacity=events, max_file_bytes=256 * 1024, keep=3)
+        frame = tele.define("frame", "dt_ms", "work_ms", "enemies")
+        tele.start(directory)
+        t0 = time.perf_counter()
+        for i in range(events):
+            tele.record(frame, 16.6, 3.2, i & 63)
+        per_event = (time.perf_counter() - t0) / events
+        t0 = time.perf_counter()
+        tele.close(timeout=None)
+        drain = time.perf_counter() - t0
+        files = glob.glob(os.path.join(directory, "*.jsonl.gz"))
+        size = sum(os.path.getsize(f) for f in files)
+        results["record"] = per_event
+        results["writer_events_per_s"] = tele.written / max(drain, 1e-9)
+        print(f"record(): {per_event * 1e9:7.0f} нс/подію; потік запису: ~{tele.written / drain:,.0f} подій/с "
+              f"(дописав залишок за {drain:.2f} с), відкинуто {tele.dropped}")
+        print(f"ротація: файлів {len(files)} (keep={tele.keep}), {size / 1024:.0f} KiB стиснено")
+
+        # сплеск без пауз: потік запису не встигає, буфер повний — події рахуються як відкинуті
+        tele = Telemetry(capacity=4096, flush_interval=0.05)
+        frame = tele.define("frame", "dt_ms", "work_ms", "enemies")
+        tele.start(directory, prefix="burst")
+        t0 = time.perf_counter()
+        for i in range(burst):
+            tele.record(frame, 16.6, 3.2, i & 63)
+        elapsed = time.perf_counter() - t0
+        tele.close()
+        results["burst_dropped"] = tele.dropped
+        print(f"сплеск {burst} подій за {elapsed * 1000:.1f} ms: записано {tele.written}, "
+              f"відкинуто {tele.dropped} (буфер {tele.capacity})")
+    return results
+
+
+BENCHMARKS = {
+    "startup": bench_startup,
+    "import": bench_import,
+    "render": bench_render,
+    "scroll": bench_scroll,
+    "zoom": bench_zoom,
+    "mining": bench_mining,
+    "net": bench_net,
+    "lighting": bench_lighting,
+    "contacts": bench_contacts,
+    "particles": bench_particles,
+    "telemetry": bench_telemetry,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
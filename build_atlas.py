@@ -0,0 +1,77 @@
+"""Збирає всі спрайти гри в один атлас (atlas.png + atlas.json).
+
+Запуск:  python build_atlas.py
+Після зміни PNG гра бере цей спрайт з окремого файлу (індекс пам'ятає
+mtime джерел), доки атлас не перезібрано.
+"""
+import json
+import os
+
+import pygame
+
+from forager.assets import ATLAS_IMAGE, ATLAS_INDEX, asset_path, atlas_key, source_mtime
+
+# -------------------------------
+# Які спрайти і в яких розмірах використовує гра
+# -------------------------------
+BLOCK_SIZE = (50, 50)
+TREE_SIZE = (50, 100)
+PLAYER_SIZE = (50, 50)
+
+ATLAS_SPRITES = (
+    [(f"{ore}.png", BLOCK_SIZE) for ore in ("coal", "gold", "iron")]
+    + [(f"{ore}{i}.png", BLOCK_SIZE) for ore in ("coal", "gold", "iron") for i in range(1, 5)]
+    + [("tree.png", TREE_SIZE)]
+    + [(f"tree{i}.png", TREE_SIZE) for i in range(1, 5)]
+    + [("player.png", PLAYER_SIZE), ("player_left.png", PLAYER_SIZE)]
+    + [(f"player_mine{i}.png", PLAYER_SIZE) for i in range(1, 5)]
+    + [("hurd.png", (40, 40)), ("hungry.png", (30, 30))]
+)
+
+ATLAS_WIDTH = 512
+PADDING = 1
+
+
+def pack(sizes, width=ATLAS_WIDTH, padding=PADDING):
+    """Полична упаковка: повертає (позиції у порядку sizes, висота атласу)."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > width:
+            x = 0
+            y += shelf_h + padding
+            shelf_h = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+
+def build(sprites=ATLAS_SPRITES, image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX):
+    """Масштабує спрайти до ігрових розмірів і записує атлас та індекс."""
+    present = [(path, size) for path, size in sprites if os.path.exists(asset_path(path))]
+    positions, height = pack([size for _, size in present])
+
+    sheet = pygame.Surface((ATLAS_WIDTH, max(1, height)), pygame.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    index = {}
+    sources = {}
+    for (path, size), (x, y) in zip(present, positions):
+        img = pygame.transform.scale(pygame.image.load(asset_path(path)), size)
+        # MAX на прозорому тлі = точна копія пікселів разом з альфою
+        sheet.blit(img, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        index[atlas_key(path, size)] = [x, y, size[0], size[1]]
+        sources[path] = source_mtime(path)
+
+    pygame.image.save(sheet, image_path)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"image": os.path.basename(image_path), "sprites": index, "sources": sources},
+                  f, indent=1, sort_keys=True)
+    return len(index), (ATLAS_WIDTH, height)
+
+
+if __name__ == "__main__":
+    count, (w, h) = build()
+    print(f"{count} спрайтів -> {ATLAS_IMAGE} ({w}x{h}), індекс {ATLAS_INDEX}")
@@ -0,0 +1,28 @@
+"""Forager-like Game.
+
+Модулі пакета не мають побічних ефектів при імпорті: вікно, шрифти, картинки
+і шари світу створюються при першому зверненні (див. game.py).
+
+  game            — сутності, системи, малювання, цикли гри/сервера/глядача
+  ecs             — світ сутностей і компонентів
+  collision       — просторова сітка і рух з ковзанням
+  contacts        — події початку/кінця дотиків
+  ai_lod          — планувальник ШІ ворогів за відстанню
+  animation       — спільні кліпи анімацій
+  assets          — кеш зображень і атлас
+  render_backend  — програмний бліт або текстури SDL Renderer
+  static_layer    — статичний шар світу, що зсувається за камерою
+  camera          — камера з дискретним зумом
+  mipmaps         — LRU-кеш масштабованих копій спрайтів
+  lighting        — світло і туман війни (numpy)
+  particles       — частинки (numpy)
+  minimap         — мінімапа HUD
+  worldgen        — процедурна генерація (numpy)
+  net             — сервер і клієнт знімків
+  memstats        — монітор пам'яті
+  telemetry       — телеметрія сесії: кільцевий буфер і фоновий запис
+  hotreload       — стеження за файлами картинок і перезавантаження на льоту
+
+Запуск:  python -m forager [--seed N] [--world PX] [--renderer sdl2] [--telemetry DIR] [--hot-reload]
+                          [--server | --connect HOST:PORT]
+"""
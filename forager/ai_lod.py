@@ -0,0 +1,78 @@
+"""Рівні деталізації ШІ: хто з ворогів оновлюється в цьому тіку.
+
+  близькі (< near)      — щотіку;
+  дальні (near..far)    — по черзі, 1/stagger з них за тік; пропущений час
+                          накопичується і віддається при оновленні (dt-компенсація);
+  сплячі (> far)        — не оновлюються зовсім і час не накопичують.
+
+Бюджет budget_ms обмежує час ШІ за тік: спершу йдуть близькі, потім
+дальні; в обох чергах першими — ті, хто довше чекає (серед близьких, що
+чекають однаково, — від найближчого). Кого не встигли — наступного тіку
+стануть на початок черги зі своїм накопиченим dt.
+"""
+import time
+
+
+class AIScheduler:
+    def __init__(self, near=450, far=1500, stagger=4, budget_ms=2.0, max_step=250):
+        self.near = near
+        self.far = far
+        self.stagger = stagger
+        self.budget_ms = budget_ms
+        self.max_step = max_step  # довший накопичений dt обрізаємо, як MAX_DT у циклі
+        self.tick = 0
+        self.pending = {}         # сутність -> ще не відданий час (мс)
+        self.stats = {}
+
+    def clear(self):
+        self.pending.clear()
+
+    def run(self, agents, center, dt, update):
+        """agents: (сутність, агент з rect); update(агент, dt) виконує крок ШІ."""
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000
+        cx, cy = center
+        near2, far2 = self.near * self.near, self.far * self.far
+        self.tick += 1
+        phase = self.tick % self.stagger
+
+        old_pending = self.pending
+        pending = self.pending = {}
+        close, distant = [], []
+        dormant = 0
+        for entity, agent in agents:
+            dx = agent.rect.centerx - cx
+            dy = agent.rect.centery - cy
+            dist2 = dx * dx + dy * dy
+            if dist2 > far2:
+                dormant += 1
+                continue
+            waited = pending[entity] = old_pending.get(entity, 0) + dt
+            if dist2 <= near2:
+                close.append((-waited, dist2, entity, agent))
+            elif entity % self.stagger == phase or waited > self.stagger * dt:
+                # своя черга, або пропустив її через бюджет
+                distant.append((-waited, entity, entity, agent))
+
+        # за чеканням, інакше пропущені через бюджет пропускалися б щотіку знову
+        close.sort(key=lambda item: item[:2])
+        distant.sort(key=lambda item: item[0])
+        updated = deferred = 0
+        for queue in (close, distant):
+            for _, _, entity, agent in queue:
+                if time.perf_counter() > deadline:
+                    deferred += 1
+                    continue
+                update(agent, min(pending[entity], self.max_step))
+                pending[entity] = 0
+                updated += 1
+
+        self.stats = {
+            "near": len(close),
+            "far": len(pending) - len(close),
+            "dormant": dormant,
+            "updated": updated,
+            "deferred": deferred,
+            "ms": (time.perf_counter() - started) * 1000,
+        }
+        return self.stats
@@ -0,0 +1,44 @@
+"""Спільні анімації: кліп описується один раз, екземпляр тримає лише id і час старту.
+
+Поточний кадр обчислюється з ігрового годинника в момент малювання, тож
+спрайти без активної анімації нічого не коштують на кожному тіку.
+"""
+
+# -------------------------------
+# Реєстр кліпів
+# -------------------------------
+class Clip:
+    __slots__ = ("frames", "frame_ms", "loop", "duration")
+
+    def __init__(self, frames, frame_ms, loop):
+        self.frames = tuple(frames)
+        self.frame_ms = frame_ms
+        self.loop = loop
+        self.duration = frame_ms * len(self.frames)
+
+
+CLIPS = {}
+
+
+def define_clip(clip_id, frames, frame_ms, loop=True):
+    """Реєструє кліп (якщо ще не зареєстрований) і повертає його id."""
+    if clip_id not in CLIPS:
+        CLIPS[clip_id] = Clip(frames, frame_ms, loop)
+    return clip_id
+
+
+def frame_at(clip_id, start, now):
+    """Кадр кліпу на момент now (мс ігрового часу); після кінця — останній кадр."""
+    clip = CLIPS[clip_id]
+    index = int(max(0, now - start) // clip.frame_ms)
+    if clip.loop:
+        index %= len(clip.frames)
+    else:
+        index = min(index, len(clip.frames) - 1)
+    return clip.frames[index]
+
+
+def is_finished(clip_id, start, now):
+    """Чи скінчився неповторюваний кліп (зациклені не закінчуються ніколи)."""
+    clip = CLIPS[clip_id]
+    return not clip.loop and now - start >= clip.duration
@@ -0,0 +1,154 @@
+import json
+import os
+
+import pygame
+
+# -------------------------------
+# Атлас спрайтів
+# -------------------------------
+# Атлас збирається скриптом build_atlas.py: усі спрайти вже масштабовані до
+# ігрових розмірів і складені в одну картинку + JSON-індекс. Якщо атласу
+# немає — працюємо як раніше, з окремими PNG. Так само й для спрайта, PNG
+# якого змінили після збирання атласу: індекс пам'ятає mtime джерел, і
+# застарілий запис пропускається, поки атлас не перезберуть.
+#
+# Картинки лежать у корені репозиторію, поряд із пакетом, тож шляхи не
+# залежать від поточної теки (тести, інструменти, запуск через -m).
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def asset_path(name):
+    """Повний шлях до файлу ресурсу за його ім'ям ('coal1.png')."""
+    return os.path.join(ASSET_DIR, name)
+
+
+ATLAS_IMAGE = asset_path("atlas.png")
+ATLAS_INDEX = asset_path("atlas.json")
+
+_atlas = None          # (Surface, {ключ: (x, y, w, h)}) або False, якщо атласу немає
+_image_cache = {}      # (path, size, fill_color) -> Surface
+
+
+def atlas_key(path, size):
+    """Ключ спрайту в індексі атласу: 'coal1.png@50x50'."""
+    return f"{path}@{size[0]}x{size[1]}"
+
+
+def source_mtime(path):
+    """mtime_ns файлу ресурсу або None, якщо його немає."""
+    try:
+        return os.stat(asset_path(path)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _fresh_sprites(index):
+    """Записи індексу, PNG яких не змінювались після збирання атласу."""
+    sources = index.get("sources")
+    if sources is None:
+        # індекс старого формату: порівнюємо з часом самого атласу
+        built = source_mtime(ATLAS_IMAGE)
+        fresh = {path for path in {key.rsplit("@", 1)[0] for key in index["sprites"]}
+                 if (source_mtime(path) or 0) <= built}
+    else:
+        fresh = {path for path, mtime in sources.items() if source_mtime(path) == mtime}
+    return {key: tuple(rect) for key, rect in index["sprites"].items() if key.rsplit("@", 1)[0] in fresh}
+
+
+def load_atlas():
+    """Один раз відкриває атлас та індекс; повертає (Surface, dict) або None."""
+    global _atlas
+    if _atlas is None:
+        _atlas = False
+        if os.path.exists(ATLAS_IMAGE) and os.path.exists(ATLAS_INDEX):
+            with open(ATLAS_INDEX, encoding="utf-8") as f:
+                index = json.load(f)
+            sheet = pygame.image.load(ATLAS_IMAGE)
+            if pygame.display.get_surface() is not None:
+                sheet = sheet.convert_alpha()
+            _atlas = (sheet, _fresh_sprites(index))
+    return _atlas or None
+
+
+def _from_atlas(path, size):
+    atlas = load_atlas()
+    if not atlas or not path or not size:
+        return None
+    sheet, index = atlas
+    rect = index.get(atlas_key(path, size))
+    if rect is None:
+        return None
+    # subsurface ділить пікселі з атласом — жодного копіювання
+    return sheet.subsurface(rect)
+
+
+def safe_load_image(path, size=None, fill_color=(255, 0, 255)):
+    """Повертає Surface: з атласу, з файлу або підкладку, якщо файлу немає.
+
+    Результат кешується, тож повторні виклики (кожен новий блок) не
+    звертаються до диска. Повернений Surface спільний — не змінюйте його.
+    """
+    key = (path, size, fill_color)
+    img = _image_cache.get(key)
+    if img is not None:
+        return img
+
+    img = _from_atlas(path, size)
+    if img is None:
+        full_path = asset_path(path) if path else None
+        if full_path and os.path.exists(full_path):
+            img = pygame.image.load(full_path)
+            # без вікна set_mode (безголово, sdl2-рендер) конвертувати нема в що
+            if pygame.display.get_surface() is not None:
+                img = img.convert_alpha()
+            if size:
+                img = pygame.transform.scale(img, size)
+        else:
+            size = size or (32, 32)
+            img = pygame.Surface(size, pygame.SRCALPHA)
+            img.fill(fill_color)
+    _image_cache[key] = img
+    return img
+
+
+def load_animation(prefix, count, size):
+    """Підвантажує кадри prefix1.png..prefixN.png (або підкладки)."""
+    frames = []
+    for i in range(1, count + 1):
+        path = f"{prefix}{i}.png"
+        frames.append(safe_load_image(path, size))
+    return frames
+
+
+def cached_names():
+    """Імена файлів, картинки з яких зараз є в кеші (за ними стежить hotreload)."""
+    return {key[0] for key in list(_image_cache) if key[0]}
+
+
+def reload_image(path, source):
+    """Переписує на місці пікселі всіх кешованих копій path зі свіжого source.
+
+    Surface лишаються тими самими об'єктами, тож блоки, гравець і кліпи, що
+    їх тримають, наступного кадру малюють нову картинку. Ігровий розмір не
+    змінюється: source масштабується під кожну копію. Повертає оновлені Surface.
+    """
+    if pygame.display.get_surface() is not None:
+        source = source.convert_alpha()
+    updated = []
+    for (key_path, _, _), img in list(_image_cache.items()):
+        if key_path != path:
+            continue
+        size = img.get_size()
+        fresh = source if source.get_size() == size else pygame.transform.scale(source, size)
+        # очищення + додавання копіює і альфу (звичайний бліт змішав би зі старим)
+        img.fill((0, 0, 0, 0))
+        img.blit(fresh, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        updated.append(img)
+    return updated
+
+
+def clear_cache():
+    """Скидає кеш зображень і атлас (наступне звернення читає їх заново)."""
+    global _atlas
+    _image_cache.clear()
+    _atlas = None
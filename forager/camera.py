@@ -0,0 +1,121 @@
+"""Камера з дискретним зумом.
+
+Спрайти малюють себе як завжди — surface.blit(image, (x - camera_x, y - camera_y))
+у світових пікселях. Коли зум не 1, замість поверхні їм дається ZoomView:
+він переводить позицію в екранні пікселі і бере масштабовану копію
+картинки з MipCache. Екранна позиція рахується від світових координат
+(floor(x * zoom) - floor(camera_x * zoom)), тож не залежить від того,
+яким шматком кадру малюється об'єкт, — це потрібно static_layer для scroll.
+"""
+import math
+
+import pygame
+
+from .mipmaps import MipCache
+
+ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.5, 2.0)
+
+
+# -------------------------------
+# Перерахунок координат
+# -------------------------------
+def screen_origin(camera_x, camera_y, zoom):
+    """Екранні координати світового (camera_x, camera_y) — цілі для scroll."""
+    return math.floor(camera_x * zoom), math.floor(camera_y * zoom)
+
+
+def world_to_screen(rect, camera_x, camera_y, zoom):
+    """Світовий rect -> екранний, із запасом на округлення розмірів копій."""
+    sx, sy = screen_origin(camera_x, camera_y, zoom)
+    x, y = math.floor(rect.x * zoom) - sx, math.floor(rect.y * zoom) - sy
+    return pygame.Rect(x, y, math.ceil(rect.right * zoom) - sx - x + 1,
+                       math.ceil(rect.bottom * zoom) - sy - y + 1)
+
+
+def screen_to_world(area, camera_x, camera_y, zoom):
+    """Екранна area -> світовий rect, що її покриває."""
+    sx, sy = screen_origin(camera_x, camera_y, zoom)
+    x, y = math.floor((area.x + sx) / zoom), math.floor((area.y + sy) / zoom)
+    return pygame.Rect(x, y, math.ceil((area.right + sx) / zoom) - x + 1,
+                       math.ceil((area.bottom + sy) / zoom) - y + 1)
+
+
+class ZoomView:
+    """Обгортка Surface/бекенду: приймає світові позиції відносно камери."""
+
+    def __init__(self, target, camera_x, camera_y, zoom, cache):
+        self.target = target
+        self.camera_x = camera_x
+        self.camera_y = camera_y
+        self.zoom = zoom
+        self.cache = cache
+        self.origin = screen_origin(camera_x, camera_y, zoom)
+
+    def get_size(self):
+        w, h = self.target.get_size()
+        return math.ceil(w / self.zoom), math.ceil(h / self.zoom)
+
+    def get_width(self):
+        return self.get_size()[0]
+
+    def get_height(self):
+        return self.get_size()[1]
+
+    def blit(self, image, pos, special_flags=0):
+        zoom = self.zoom
+        x = math.floor((pos[0] + self.camera_x) * zoom) - self.origin[0]
+        y = math.floor((pos[1] + self.camera_y) * zoom) - self.origin[1]
+        self.target.blit(self.cache.get(image, zoom), (x, y), special_flags=special_flags)
+
+    def fill(self, color, rect=None):
+        if rect is None:
+            self.target.fill(color)
+            return
+        rect = pygame.Rect(rect).move(self.camera_x, self.camera_y)
+        self.target.fill(color, world_to_screen(rect, self.camera_x, self.camera_y, self.zoom))
+
+
+def zoom_view(surface, camera_x, camera_y, zoom, cache):
+    """surface як є при зумі 1 (без накладних витрат), інакше ZoomView."""
+    if zoom == 1:
+        return surface
+    return ZoomView(surface, camera_x, camera_y, zoom, cache)
+
+
+# -------------------------------
+# Камера
+# -------------------------------
+class Camera:
+    def __init__(self, size, levels=ZOOM_LEVELS, cache=None):
+        self.size = size
+        self.levels = levels
+        self.level = levels.index(1.0)
+        self.cache = cache if cache is not None else MipCache()
+        self.x = self.y = 0
+
+    @property
+    def zoom(self):
+        return self.levels[self.level]
+
+    def zoom_in(self):
+        self.level = min(self.level + 1, len(self.levels) - 1)
+
+    def zoom_out(self):
+        self.level = max(self.level - 1, 0)
+
+    def reset_zoom(self):
+        self.level = self.levels.index(1.0)
+
+    def view_size(self):
+        """Скільки світових пікселів видно при поточному зумі."""
+        return math.ceil(self.size[0] / self.zoom), math.ceil(self.size[1] / self.zoom)
+
+    def follow(self, center, world_width, world_height):
+        """Ставить камеру центром на center, не виходячи за межі світу."""
+        view_w, view_h = self.view_size()
+        self.x = max(0, min(center[0] - view_w // 2, world_width - view_w))
+        self.y = max(0, min(center[1] - view_h // 2, world_height - view_h))
+        return self.x, self.y
+
+    def view(self, surface):
+        return zoom_view(surface, self.x, self.y, self.zoom, self.cache)
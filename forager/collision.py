@@ -0,0 +1,144 @@
+"""Колізії: просторова сітка для широкої фази і swept-AABB з ковзанням.
+
+Рух розв'язується неперервно: шукаємо найраніший момент зіткнення на
+відрізку руху, доходимо до перешкоди і ковзаємо вздовж неї рештою шляху.
+Тому навіть за великого dt сутності не «проскакують» крізь тонкі стіни.
+"""
+
+import pygame
+
+INF = float("inf")
+
+
+# -------------------------------
+# Широка фаза
+# -------------------------------
+class SpatialHash:
+    """Рівномірна сітка: клітинка -> множина об'єктів з атрибутом rect."""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.object_cells = {}
+
+    def _cells_for(self, left, top, right, bottom):
+        cs = self.cell_size
+        for cx in range(int(left // cs), int((right - 1) // cs) + 1):
+            for cy in range(int(top // cs), int((bottom - 1) // cs) + 1):
+                yield cx, cy
+
+    def insert(self, obj, rect=None):
+        rect = rect or obj.rect
+        keys = tuple(self._cells_for(rect.left, rect.top, rect.right, rect.bottom))
+        for key in keys:
+            self.cells.setdefault(key, set()).add(obj)
+        self.object_cells[obj] = keys
+
+    def remove(self, obj):
+        for key in self.object_cells.pop(obj, ()):
+            bucket = self.cells.get(key)
+            if bucket is not None:
+                bucket.discard(obj)
+                if not bucket:
+                    del self.cells[key]
+
+    def query(self, left, top, right, bottom):
+        """Усі об'єкти з клітинок, які зачіпає прямокутник (без точної перевірки)."""
+        found = set()
+        cells = self.cells
+        for key in self._cells_for(left, top, right, bottom):
+            bucket = cells.get(key)
+            if bucket:
+                found |= bucket
+        return found
+
+    def query_rect(self, rect):
+        return self.query(rect.left, rect.top, rect.right, rect.bottom)
+
+    def clear(self):
+        self.cells.clear()
+        self.object_cells.clear()
+
+    def __contains__(self, obj):
+        return obj in self.object_cells
+
+    def __len__(self):
+        return len(self.object_cells)
+
+
+# -------------------------------
+# Вузька фаза
+# -------------------------------
+def sweep(x, y, w, h, dx, dy, rect):
+    """Swept-AABB: (t, nx, ny) першого торкання rect на відрізку руху, t у [0, 1].
+
+    Якщо зіткнення немає (або коробка вже перекривається з rect) — (INF, 0, 0).
+    Дотик ребрами, як і в pygame.Rect.colliderect, не вважається перетином.
+    """
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    if x < right and x + w > left and y < bottom and y + h > top:
+        return INF, 0, 0  # уже всередині — даємо вийти
+
+    if dx > 0:
+        x_entry, x_exit = (left - (x + w)) / dx, (right - x) / dx
+    elif dx < 0:
+        x_entry, x_exit = (right - x) / dx, (left - (x + w)) / dx
+    elif x < right and x + w > left:
+        x_entry, x_exit = -INF, INF
+    else:
+        return INF, 0, 0
+
+    if dy > 0:
+        y_entry, y_exit = (top - (y + h)) / dy, (bottom - y) / dy
+    elif dy < 0:
+        y_entry, y_exit = (bottom - y) / dy, (top - (y + h)) / dy
+    elif y < bottom and y + h > top:
+        y_entry, y_exit = -INF, INF
+    else:
+        return INF, 0, 0
+
+    entry = max(x_entry, y_entry)
+    exit_ = min(x_exit, y_exit)
+    if entry >= exit_ or entry < 0 or entry > 1:
+        return INF, 0, 0
+    if x_entry > y_entry:
+        return entry, (-1 if dx > 0 else 1), 0
+    return entry, 0, (-1 if dy > 0 else 1)
+
+
+def move_and_slide(x, y, w, h, dx, dy, grid, max_slides=3):
+    """Рухає коробку на (dx, dy) з ковзанням уздовж перешкод із grid.
+
+    Повертає (x, y, hit): нову позицію і чи було хоч одне зіткнення.
+    Кандидати беруться з сітки один раз — по габариту всього руху.
+    """
+    if not dx and not dy:
+        return x, y, False
+    left, top = min(x, x + dx), min(y, y + dy)
+    right, bottom = max(x, x + dx) + w, max(y, y + dy) + h
+    # габарит руху (з запасом 1px на дотик) — відсікаємо кандидатів без sweep()
+    bounds = pygame.Rect(int(left) - 1, int(top) - 1, int(right - left) + 3, int(bottom - top) + 3)
+    rects = [obj.rect for obj in grid.query(left, top, right, bottom) if bounds.colliderect(obj.rect)]
+    hit = False
+    for _ in range(max_slides):
+        if not dx and not dy:
+            break
+        t_min, nx, ny, wall = INF, 0, 0, None
+        for rect in rects:
+            t, tnx, tny = sweep(x, y, w, h, dx, dy, rect)
+            if t < t_min:
+                t_min, nx, ny, wall = t, tnx, tny, rect
+        if wall is None:
+            return x + dx, y + dy, hit
+
+        hit = True
+        # доходимо до контакту і ставимо коробку рівно впритул
+        if nx:
+            x = wall.left - w if nx < 0 else wall.right
+            y += dy * t_min
+            dx, dy = 0, dy * (1 - t_min)
+        else:
+            y = wall.top - h if ny < 0 else wall.bottom
+            x += dx * t_min
+            dx, dy = dx * (1 - t_min), 0
+    return x, y, hit
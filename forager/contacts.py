@@ -0,0 +1,104 @@
+"""Події контактів: початок і кінець дотику пар тіл з однієї широкої фази.
+
+Усі тіла (статичні блоки й рухомі гравець, вороги, предмети) лежать в одній
+просторовій сітці. Раз за тік перевіряються сусіди лише рухомих тіл і лише
+для тих пар шарів, на які підписано обробники, тож ціна залежить від
+кількості реальних контактів, а не від кількості блоків у світі.
+
+Обробники викликаються після обходу сітки, тож у них можна змінювати світ
+(знищувати предмети тощо). Знищене тіло приберіть через remove(): його
+контакти завершаться на наступному step() звичайною подією end.
+"""
+from .collision import SpatialHash
+
+
+class ContactSystem:
+    def __init__(self, cell_size=64, margin=1):
+        self.grid = SpatialHash(cell_size)
+        self.margin = margin     # дотик упритул (рух зупиняється врівень) теж контакт
+        self.layers = {}         # тіло -> шар
+        self.rects = {}          # тіло -> pygame.Rect
+        self.handlers = {}       # (шар_a, шар_b) -> (begin, end)
+        self.contacts = {}       # (a, b) -> ключ обробника
+        self._dynamic = set()
+        self._placed = {}        # рухоме тіло -> (x, y, w, h), де воно лежить у сітці
+
+    def on(self, layer_a, layer_b, begin=None, end=None):
+        """Підписка на пари шарів; обробники отримують (тіло_a, тіло_b)."""
+        self.handlers[(layer_a, layer_b)] = (begin, end)
+
+    # -------------------------------
+    # Тіла
+    # -------------------------------
+    def add_static(self, body, layer, rect):
+        self.layers[body] = layer
+        self.rects[body] = rect
+        self.grid.insert(body, rect)
+
+    def remove(self, body):
+        self.grid.remove(body)
+        self.layers.pop(body, None)
+        self.rects.pop(body, None)
+        self._placed.pop(body, None)
+        self._dynamic.discard(body)
+
+    def clear(self):
+        self.grid.clear()
+        self.layers.clear()
+        self.rects.clear()
+        self.contacts.clear()
+        self._dynamic.clear()
+        self._placed.clear()
+
+    # -------------------------------
+    # Тік
+    # -------------------------------
+    def step(self, bodies):
+        """bodies: (тіло, rect, шар) рухомих тіл; повертає (почалися, закінчилися)."""
+        grid, layers, rects, placed = self.grid, self.layers, self.rects, self._placed
+        seen = set()
+        for body, rect, layer in bodies:
+            seen.add(body)
+            layers[body] = layer
+            rects[body] = rect
+            key = (rect.x, rect.y, rect.width, rect.height)
+            if placed.get(body) != key:
+                grid.remove(body)
+                grid.insert(body, rect)
+                placed[body] = key
+        for body in self._dynamic - seen:
+            self.remove(body)
+        self._dynamic = seen
+
+        handlers = self.handlers
+        current = {}
+        m = self.margin
+        for a in seen:
+            layer_a = layers[a]
+            probe = rects[a].inflate(2 * m, 2 * m)
+            for b in grid.query_rect(probe):
+                if b == a:
+                    continue
+                layer_b = layers[b]
+                if (layer_a, layer_b) in handlers:
+                    pair, key = (a, b), (layer_a, layer_b)
+                elif (layer_b, layer_a) in handlers:
+                    pair, key = (b, a), (layer_b, layer_a)
+                else:
+                    continue
+                if probe.colliderect(rects[b]):
+                    current[pair] = key
+
+        previous = self.contacts
+        self.contacts = current
+        ended = sorted(pair for pair in previous if pair not in current)
+        began = sorted(pair for pair in current if pair not in previous)
+        for pair in ended:
+            end = handlers[previous[pair]][1]
+            if end:
+                end(*pair)
+        for pair in began:
+            begin = handlers[current[pair]][0]
+            if begin:
+                begin(*pair)
+        return began, ended
@@ -0,0 +1,176 @@
+"""Мінімальне ядро entity-component-system з архетипним зберіганням.
+
+Сутність — ціле число. Компоненти іменовані рядками; сутності з однаковим
+набором компонентів лежать в одному архетипі, де кожен компонент — щільна
+колонка (список). Запит обходить лише архетипи з потрібними компонентами,
+тож нова система чи новий тип сутностей не додає роботи іншим системам.
+
+Під час обходу query() не можна змінювати склад світу (create/destroy/
+add/remove): зберіть зміни у список і застосуйте після циклу.
+"""
+
+
+class Archetype:
+    __slots__ = ("signature", "entities", "columns")
+
+    def __init__(self, signature):
+        self.signature = signature
+        self.entities = []
+        self.columns = {name: [] for name in signature}
+
+    def __len__(self):
+        return len(self.entities)
+
+
+class World:
+    def __init__(self):
+        self.archetypes = {}    # frozenset імен -> Archetype
+        self.locations = {}     # сутність -> (Archetype, рядок)
+        self._next_entity = 1
+        self._query_cache = {}
+
+    # -------------------------------
+    # Сутності
+    # -------------------------------
+    def create(self, **components):
+        """Створює сутність з компонентами name=value і повертає її id."""
+        entity = self._next_entity
+        self._next_entity += 1
+        self._insert(entity, components)
+        return entity
+
+    def destroy(self, entity):
+        arch, row = self.locations.pop(entity)
+        self._take_row(arch, row)
+
+    def clear(self):
+        self.archetypes.clear()
+        self.locations.clear()
+        self._query_cache.clear()
+
+    def __contains__(self, entity):
+        return entity in self.locations
+
+    def __len__(self):
+        return len(self.locations)
+
+    # -------------------------------
+    # Компоненти
+    # -------------------------------
+    def get(self, entity, name, default=None):
+        location = self.locations.get(entity)
+        if location is None:
+            return default
+        column = location[0].columns.get(name)
+        return default if column is None else column[location[1]]
+
+    def has(self, entity, name):
+        location = self.locations.get(entity)
+        return location is not None and name in location[0].columns
+
+    def add(self, entity, name, value):
+        """Додає (або замінює) компонент; сутність переїжджає в інший архетип."""
+        arch, row = self.locations[entity]
+        if name in arch.columns:
+            arch.columns[name][row] = value
+            return
+        components = self._take_row(arch, row)
+        components[name] = value
+        self._insert(entity, components)
+
+    def remove(self, entity, name):
+        arch, row = self.locations[entity]
+        if name not in arch.columns:
+            return
+        components = self._take_row(arch, row)
+        del components[name]
+        self._insert(entity, components)
+
+    def change_many(self, entities, add=None, remove=()):
+        """Пакетні add/remove для багатьох сутностей.
+
+        add — {назва: список значень у порядку entities}. Цільовий архетип
+        шукається раз на архетип-джерело, а не раз на сутність, і сутності
+        переїжджають одним проходом замість двох переїздів на кожну.
+        """
+        add = add or {}
+        removed = frozenset(remove)
+        groups = {}
+        for i, entity in enumerate(entities):
+            arch, row = self.locations[entity]
+            groups.setdefault(arch, []).append((row, i, entity))
+        for arch, members in groups.items():
+            signature = (arch.signature - removed) | frozenset(add)
+            if signature == arch.signature:
+                for row, i, _ in members:
+                    for name, values in add.items():
+                        arch.columns[name][row] = values[i]
+                continue
+            target = self.archetypes.get(signature)
+            if target is None:
+                target = self.archetypes[signature] = Archetype(signature)
+                self._query_cache.clear()
+            # з кінця: swap-remove не зсуває рядки, які ще треба забрати
+            members.sort(reverse=True)
+            taken = [self._take_row(arch, row) for row, _, _ in members]
+            base = len(target.entities)
+            for offset, (_, _, entity) in enumerate(members):
+                self.locations[entity] = (target, base + offset)
+            target.entities.extend(entity for _, _, entity in members)
+            for name, column in target.columns.items():
+                values = add.get(name)
+                if values is None:
+                    column.extend(components[name] for components in taken)
+                else:
+                    column.extend(values[i] for _, i, _ in members)
+
+    # -------------------------------
+    # Запити
+    # -------------------------------
+    def archetypes_with(self, names, exclude=()):
+        key = (names, exclude)
+        matched = self._query_cache.get(key)
+        if matched is None:
+            wanted, banned = set(names), set(exclude)
+            matched = [arch for sig, arch in self.archetypes.items()
+                       if wanted <= sig and not banned & sig]
+            self._query_cache[key] = matched
+        return matched
+
+    def query(self, *names, exclude=()):
+        """Ітерує (entity, (значення компонентів у порядку names))."""
+        for arch in self.archetypes_with(names, tuple(exclude)):
+            if arch.entities:
+                yield from zip(arch.entities, zip(*[arch.columns[n] for n in names]))
+
+    def count(self, *names, exclude=()):
+        return sum(len(arch) for arch in self.archetypes_with(names, tuple(exclude)))
+
+    # -------------------------------
+    # Внутрішнє
+    # -------------------------------
+    def _insert(self, entity, components):
+        signature = frozenset(components)
+        arch = self.archetypes.get(signature)
+        if arch is None:
+            arch = self.archetypes[signature] = Archetype(signature)
+            self._query_cache.clear()
+        self.locations[entity] = (arch, len(arch.entities))
+        arch.entities.append(entity)
+        for name, value in components.items():
+            arch.columns[name].append(value)
+
+    def _take_row(self, arch, row):
+        """Вилучає рядок з архетипу (swap-remove) і повертає його компоненти."""
+        last = len(arch.entities) - 1
+        components = {}
+        for name, column in arch.columns.items():
+            components[name] = column[row]
+            column[row] = column[last]
+            column.pop()
+        moved = arch.entities[last]
+        arch.entities[row] = moved
+        arch.entities.pop()
+        if moved in self.locations and row != last:
+            self.locations[moved] = (arch, row)
+        return components
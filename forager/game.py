@@ -0,0 +1,1231 @@
+"""Гра: сутності, системи, малювання і цикли (вікно, сервер, глядач).
+
+Імпорт нічого не відкриває і не завантажує. Вікно створює display(), шрифти
+— font(), картинки — assets при першому зверненні; світ (стіни, мінімапа,
+світло, частинки) будується першим reset_game_state(). Інструменти й тести
+платять лише за те, чого торкаються; розмір світу і зерно задає configure().
+"""
+import pygame
+import sys
+import random
+import math
+import time
+import argparse
+from collections import Counter
+
+from . import animation
+from . import net
+from .ai_lod import AIScheduler
+from .assets import safe_load_image, load_animation
+from .camera import Camera, screen_to_world, zoom_view
+from .collision import SpatialHash, move_and_slide
+from .contacts import ContactSystem
+from .ecs import World
+from .hotreload import AssetWatcher
+from .minimap import Minimap
+from .memstats import MemoryMonitor
+from .render_backend import BACKENDS, TextureBackend, create_backend
+from .static_layer import StaticLayer
+from .telemetry import Telemetry
+
+# -------------------------------
+# Константи
+# -------------------------------
+TITLE = 'Forager-like Game'
+WIDTH, HEIGHT = 600, 600
+WORLD_WIDTH, WORLD_HEIGHT = 1000, 1000
+WORLD_SEED = None
+RENDERER = "surface"
+LIGHT_BLUE = (135, 206, 250)
+GREEN = (34, 139, 34)
+RED = (255, 0, 0)
+YELLOW = (255, 215, 0)
+WHITE = (255, 255, 255)
+FPS = 60
+TICK_MS = 1000 / FPS  # тривалість одного тіку при цільовому FPS
+MAX_DT = 250          # довші «зависання» кадру не перетворюємо на ривок
+
+
+def configure(world=None, seed=None, renderer=None):
+    """Параметри запуску; діють з наступного reset_game_state() / display()."""
+    global WORLD_WIDTH, WORLD_HEIGHT, WORLD_SEED, RENDERER, walls, minimap, lights
+    if world is not None and (world, world) != (WORLD_WIDTH, WORLD_HEIGHT):
+        WORLD_WIDTH, WORLD_HEIGHT = world, world
+        walls = minimap = lights = None  # збудуються заново під новий розмір
+    WORLD_SEED = seed
+    if renderer is not None:
+        RENDERER = renderer
+
+# -------------------------------
+# Вікно і шрифти (ліниво)
+# -------------------------------
+# gfx — бекенд малювання (див. render_backend.py); з sdl2 set_mode не викликається
+gfx = None
+FONT_SIZES = {"big": 50, "med": 40, "small": 30, "tiny": 20}
+_fonts = {}
+
+
+def display():
+    """Бекенд малювання; вікно відкривається при першому виклику."""
+    global gfx
+    if gfx is None:
+        gfx = create_backend(RENDERER, (WIDTH, HEIGHT), TITLE)
+    return gfx
+
+
+def font(name):
+    """Шрифт за назвою розміру з FONT_SIZES ("big", "med", "small", "tiny")."""
+    f = _fonts.get(name)
+    if f is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        f = _fonts[name] = pygame.font.Font(None, FONT_SIZES[name])
+    return f
+
+# -------------------------------
+# Допоміжні функції
+# -------------------------------
+def draw_progress_bar(surface, x, y, width, height, progress, color=(0, 255, 0)):
+    pygame.draw.rect(surface, (50, 50, 50), (x, y, width, height))
+    inner_w = max(0, min(width * progress, width))
+    pygame.draw.rect(surface, color, (x, y, inner_w, height))
+    pygame.draw.rect(surface, (0, 0, 0), (x, y, width, height), 2)
+
+# -------------------------------
+# Класи
+# -------------------------------
+class Player:
+    def __init__(self, x=None, y=None):
+        self.rect = pygame.Rect(0, 0, 30, 30)
+        self.rect.center = ((x if x is not None else WORLD_WIDTH // 2),
+                            (y if y is not None else WORLD_HEIGHT // 2))
+        self.speed = 5
+        self.subpixel = (0.0, 0.0)  # дробова частина позиції (rect цілочисельний)
+        self.facing = "idle"        # "idle", "left", "right" — яку картинку малювати
+        self.is_mining = False
+        self._images = None
+        self._mining_clip = None
+
+    @property
+    def images(self):
+        # картинки (без падіння якщо немає файлів) — лише коли гравця вперше малюють
+        if self._images is None:
+            self._images = {
+                "idle": safe_load_image("player.png", (50, 50), (100, 100, 255)),
+                "left": safe_load_image("player_left.png", (50, 50), (120, 100, 255)),
+                "right": safe_load_image("player.png", (50, 50), (100, 100, 255))
+            }
+        return self._images
+
+    @property
+    def image(self):
+        return self.images[self.facing]
+
+    @property
+    def mining_clip(self):
+        if self._mining_clip is None:
+            # mining frames (можуть бути відсутні)
+            mining_frames = load_animation("player_mine", 4, (50, 50))
+            if not any(frame for frame in mining_frames):
+                # якщо немає рамок — ставимо idle як єдиний кадр
+                mining_frames = [self.images["idle"]]
+            # кадр змінюється кожні 4 тіки (як колись mining_speed = 0.25)
+            self._mining_clip = animation.define_clip("player_mine", mining_frames, TICK_MS / 0.25)
+        return self._mining_clip
+
+    def update(self, obstacles, dt=TICK_MS):
+        # зчитуємо клавіші і рухаємось; якщо копає — стоїмо
+        if self.is_mining:
+            return
+        if not pygame.display.get_init():
+            return  # безголово (сервер, тести) клавіатури немає
+        keys = pygame.key.get_pressed()
+
+        dx = dy = 0
+        if keys[pygame.K_a]:
+            dx -= self.speed
+            self.facing = "left"
+        if keys[pygame.K_d]:
+            dx += self.speed
+            self.facing = "right"
+        if not (keys[pygame.K_a] or keys[pygame.K_d]):
+            self.facing = "idle"
+        if keys[pygame.K_w]:
+            dy -= self.speed
+        if keys[pygame.K_s]:
+            dy += self.speed
+
+        # speed задано в пікселях за тік — масштабуємо на реальний dt
+        scale = dt / TICK_MS
+        self.move(dx * scale, dy * scale, obstacles)
+
+    def move(self, dx, dy, obstacles):
+        """Неперервний рух з ковзанням уздовж стін і блоків (див. collision.py)."""
+        x = self.rect.x + self.subpixel[0]
+        y = self.rect.y + self.subpixel[1]
+        x, y, _ = move_and_slide(x, y, self.rect.width, self.rect.height, dx, dy, obstacles)
+        self.rect.topleft = (math.floor(x), math.floor(y))
+        self.subpixel = (x - self.rect.x, y - self.rect.y)
+
+    def draw(self, surface, camera_x, camera_y, frame=None):
+        image = frame or self.image
+        # картинка ширша за хитбокс — центруємо її на ньому
+        x = self.rect.x - camera_x + (self.rect.width - image.get_width()) // 2
+        y = self.rect.y - camera_y + (self.rect.height - image.get_height()) // 2
+        surface.blit(image, (x, y))
+
+
+class Wall:
+    def __init__(self, x, y, width, height, color):
+        self.color = color
+        self.image = pygame.Surface((width, height))
+        self.image.fill(color)
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+    def bounds(self):
+        return self.rect
+
+    def draw(self, surface, camera_x, camera_y, frame=None):
+        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+
+
+class ColoredBlock:
+    def __init__(self, x, y, image_path, broken_path=None):
+        self.image_path = image_path
+        self.broken_path = broken_path
+        self.is_tree = "tree" in (image_path or "")
+        self.width = 50
+        self.height = 100 if self.is_tree else 50
+
+        # нормальний вигляд
+        self.image_normal = safe_load_image(image_path, (self.width, self.height))
+        # прямокутна хитбокс для дерев (створюємо невелику хитбокс-частину)
+        if self.is_tree:
+            self.rect = pygame.Rect(x, y + 50, 50, 40)
+        else:
+            self.rect = self.image_normal.get_rect(topleft=(x, y))
+
+        # зламаний вигляд (або темніший/вицвівший)
+        if broken_path:
+            self.image_broken = safe_load_image(broken_path, (self.width, self.height))
+        else:
+            self.image_broken = self.make_faded(self.image_normal)
+
+        # Анімація для певних префіксів
+        prefixes = ["coal", "gold", "iron", "tree"]
+        found_prefix = None
+        for p in prefixes:
+            if p in (image_path or ""):
+                found_prefix = p
+                break
+
+        self.kind = found_prefix
+
+        # кліп спільний для всіх блоків одного типу; кадр — кожні 5 тіків
+        self.break_clip = None
+        if found_prefix:
+            frames = load_animation(found_prefix, 4, (self.width, self.height))
+            if any(frames):
+                self.break_clip = animation.define_clip(
+                    f"break_{found_prefix}_{self.width}x{self.height}", frames, TICK_MS / 0.2, loop=False)
+
+        self.image = self.image_normal
+        # після поломки блок лишається вицвілим
+        self.is_broken = False
+        self.entity = None  # сутність у world; ставить add_block
+
+    def make_darker(self, image):
+        dark = image.copy()
+        dark.fill((0, 0, 0, 120), special_flags=pygame.BLEND_RGBA_SUB)
+        return dark
+
+    def make_faded(self, image):
+        """Повертає менш яскраву/вицвілу версію (зниження насиченості/яскравості)."""
+        faded = image.copy()
+        # помножимо RGB на 0.6 (BLEND_RGBA_MULT з (153,153,153,255) ~ 0.6)
+        faded.fill((153, 153, 153, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        # додатково зробимо трохи прозорішим (але лишимо видимим)
+        try:
+            faded.set_alpha(230)
+        except Exception:
+            pass
+        return faded
+
+    def break_block(self):
+        if self.is_broken:
+            return
+        # Невід’ємна зміна — блок не видаляємо, після анімації він лишається вицвілим
+        self.is_broken = True
+        self.image = self.image_broken
+
+    def bounds(self):
+        """Світовий прямокутник картинки (у дерева вона вища за хитбокс)."""
+        return pygame.Rect(self.rect.x, self.rect.y - (50 if self.is_tree else 0), self.width, self.height)
+
+    def draw(self, surface, camera_x, camera_y, frame=None):
+        y = self.rect.y - camera_y - (50 if self.is_tree else 0)
+        surface.blit(frame or self.image, (self.rect.x - camera_x, y))
+
+
+class Enemy:
+    def __init__(self, x, y):
+        # одна спільна червона підкладка на всіх ворогів (з кешу assets)
+        self.image = safe_load_image(None, (30, 30), fill_color=RED)
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.speed = 2.0
+        self.subpixel = (0.0, 0.0)
+        self.obstructed = 0  # скільки блоків/стін торкається (події контактів)
+
+    def update(self, player, obstacles, dt=TICK_MS):
+        dx = player.rect.centerx - self.rect.centerx
+        dy = player.rect.centery - self.rect.centery
+        dist = math.hypot(dx, dy)
+        if dist > 0:
+            dx /= dist
+            dy /= dist
+        step = self.speed * dt / TICK_MS
+
+        x = self.rect.x + self.subpixel[0]
+        y = self.rect.y + self.subpixel[1]
+        w, h = self.rect.size
+        nx, ny, _ = move_and_slide(x, y, w, h, dx * step, dy * step, obstacles)
+        if self.obstructed and abs(nx - x) + abs(ny - y) < step * 0.5:
+            # уперлися майже навпростець — спроба оточного обходу
+            nx, ny, _ = move_and_slide(x, y, w, h, -dy * step, dx * step, obstacles)
+        self.rect.topleft = (math.floor(nx), math.floor(ny))
+        self.subpixel = (nx - self.rect.x, ny - self.rect.y)
+
+    def draw(self, surface, camera_x, camera_y, frame=None):
+        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+
+class Pickup:
+    """Ресурс, що випав з розбитого блока; підбирається дотиком."""
+
+    def __init__(self, x, y, kind, count=1):
+        self.kind = kind
+        self.count = count  # скільки ресурсу дає (з розбитої площі — один предмет на тип)
+        image_path = BLOCK_IMAGES.get(kind, (None,))[0]
+        self.image = safe_load_image(image_path, (20, 20), fill_color=YELLOW)
+        self.rect = self.image.get_rect(center=(x, y))
+
+    def draw(self, surface, camera_x, camera_y, frame=None):
+        surface.blit(self.image, (self.rect.x - camera_x, self.rect.y - camera_y))
+
+# -------------------------------
+# Стіни рівня
+# -------------------------------
+wall_width = 10
+frame_margin = 10
+
+def make_walls():
+    """Рамка по краю світу і стінки навколо зеленої зони."""
+    return [
+        Wall(frame_margin, frame_margin, WORLD_WIDTH - 2 * frame_margin, wall_width, RED),
+        Wall(frame_margin, WORLD_HEIGHT - frame_margin - wall_width, WORLD_WIDTH - 2 * frame_margin, wall_width, RED),
+        Wall(frame_margin, frame_margin, wall_width, WORLD_HEIGHT - 2 * frame_margin, RED),
+        Wall(WORLD_WIDTH - frame_margin - wall_width, frame_margin, wall_width, WORLD_HEIGHT - 2 * frame_margin, RED),
+        Wall(333, 333, 333, 10, LIGHT_BLUE),
+        Wall(333, 666, 333, 10, YELLOW),
+        Wall(333, 333, 10, 343, LIGHT_BLUE),
+        Wall(666, 343, 10, 333, YELLOW)
+    ]
+
+# -------------------------------
+# Світ (ECS)
+# -------------------------------
+# Компоненти сутностей:
+#   position  — pygame.Rect: позиція і хитбокс
+#   collider  — статична перешкода; значення — об'єкт у сітці obstacles
+#   sprite    — об'єкт з draw(surface, camera_x, camera_y, frame=None)
+#   animation — (clip_id, start): анімація, що зараз грає
+#   ai        — Enemy: переслідує гравця
+#   minable   — тип ресурсу блока, який ще можна добути
+#   player    — Player: керується з клавіатури
+#   contact   — шар рухомого тіла для подій контактів ("player", "enemy", "pickup")
+#   pickup    — тип ресурсу, який дає предмет
+world = World()
+
+# Події дотиків: блоки і стіни — статичні тіла шару "block"
+contacts = ContactSystem(64)
+
+# Шари під розмір світу; створюються першим build_world() (див. init_layers)
+walls = None
+minimap = None     # статичний шар оновлюється при змінах блоків, рухомі — точками
+lights = None      # світло й туман війни (F5 — вимкнути/увімкнути)
+particles = None   # крихти під час майнінгу, уламки при поломці, іскри від удару
+
+MINIMAP_POS = (428, 45)
+GREEN_ZONE = pygame.Rect(333, 333, 333, 333)
+# Колір типу блока — один для мінімапи, частинок і глядача (--connect)
+KIND_COLORS = {
+    "coal": (40, 40, 40),
+    "iron": (180, 180, 190),
+    "gold": YELLOW,
+    "tree": (0, 100, 0),
+}
+GREY = (120, 120, 120)  # тип без свого кольору
+
+def minimap_color(block):
+    color = KIND_COLORS.get(block.kind, GREY)
+    if block.is_broken:
+        color = tuple(c * 3 // 5 for c in color)
+    return color
+
+# Статичні перешкоди (стіни + блоки) у просторовій сітці для колізій
+obstacles = SpatialHash(64)
+
+player = Player()
+
+
+class GameState:
+    """Стан сесії, який не належить жодній сутності."""
+
+    def __init__(self):
+        self.sim_time = 0  # ігровий годинник (мс); стоїть на паузі та в меню
+        self.player_entity = None
+        self.reset()
+
+    def reset(self):
+        self.xp = 0                # поточний XP
+        self.level = 1             # стартовий рівень
+        self.xp_needed = 10        # скільки потрібно для LEVEL UP (зростає)
+        self.hp_max = 3
+        self.hp = self.hp_max
+        self.mining_target = None  # сутність блока, який копаємо
+        self.mining_start_time = None
+        self.mining_progress = 0.0
+        self.next_block_spawn = self.sim_time + BLOCK_SPAWN_INTERVAL
+        self.next_enemy_spawn = self.sim_time + ENEMY_SPAWN_INTERVAL
+        self.enemy_contacts = 0     # скільки ворогів зараз торкається гравця
+        self.invulnerable_until = 0
+        self.game_over = False
+        self.inventory = {}         # тип ресурсу -> кількість підібраних
+        self.tool = "pick"          # чим копаємо: "pick", "drill", "chain" (див. TOOL_KEYS)
+
+
+def init_layers():
+    """Створює те, чого ще немає: стіни, мінімапу, світло, частинки.
+
+    lighting і particles тягнуть numpy, тож імпортуються лише тут.
+    """
+    global walls, minimap, lights, particles
+    if walls is None:
+        walls = make_walls()
+    if minimap is None:
+        minimap = Minimap(WORLD_WIDTH, WORLD_HEIGHT, background=LIGHT_BLUE)
+    if lights is None:
+        from .lighting import LightMap
+        lights = LightMap(WORLD_WIDTH, WORLD_HEIGHT)
+    if particles is None:
+        from .particles import ParticleSystem
+        particles = ParticleSystem()
+
+
+def build_world():
+    """Порожній світ: лише стіни і гравець."""
+    init_layers()
+    static_layer.invalidate()
+    world.clear()
+    obstacles.clear()
+    contacts.clear()
+    minimap.clear()
+    minimap.mark(GREEN_ZONE, GREEN)
+    for wall in walls:
+        entity = world.create(position=wall.rect, collider=wall, sprite=wall)
+        obstacles.insert(wall)
+        contacts.add_static(entity, "block", wall.rect)
+        minimap.mark(wall.rect, wall.color)
+    state.player_entity = world.create(position=player.rect, sprite=player, player=player, contact="player")
+
+# межі для спавну (взято з обох частин, узгоджено)
+inner_x_min, inner_y_min = 353, 353
+inner_x_max, inner_y_max = 596, 596
+
+# Картинки блоків за типом: (звичайна, зламана)
+BLOCK_IMAGES = {
+    "iron": ("iron.png", "iron_broken.png"),
+    "gold": ("gold.png", "gold_broken.png"),
+    "coal": ("coal.png", "coal_broken.png"),
+    "tree": ("tree.png", "tree_broken.png"),
+}
+
+# -------------------------------
+# Функції спавну (оптимізовано)
+# -------------------------------
+def add_block(block):
+    obstacles.insert(block)
+    entity = block.entity = world.create(position=block.rect, collider=block, sprite=block, minable=block.kind)
+    contacts.add_static(entity, "block", block.rect)
+    minimap.mark(block.rect, minimap_color(block))
+    static_layer.invalidate(block.bounds())
+    return entity
+
+def spawn_block(attempts=8):
+    """Спроба створити блок в межах inner_x.., уникаючи колізій."""
+    if random.choice([True, False]):
+        ores = [BLOCK_IMAGES["iron"], BLOCK_IMAGES["gold"], BLOCK_IMAGES["coal"]]
+        image_path, broken_path = random.choice(ores)
+    else:
+        image_path, broken_path = BLOCK_IMAGES["tree"]
+
+    for _ in range(attempts):
+        x = random.randint(inner_x_min, inner_x_max)
+        y = random.randint(inner_y_min, inner_y_max)
+        new_block = ColoredBlock(x, y, image_path, broken_path)
+        overlap = any(new_block.rect.colliderect(o.rect) for o in obstacles.query_rect(new_block.rect)) or new_block.rect.colliderect(player.rect)
+        if not overlap:
+            add_block(new_block)
+            return True
+    return False
+
+def populate_world(seed):
+    """Заповнює світ блоками з процедурного генератора; повертає кількість блоків."""
+    from . import worldgen
+    tile = worldgen.TILE
+    tx, ty, kinds = worldgen.generate_area(seed, 0, 0, WORLD_WIDTH, WORLD_HEIGHT, tile)
+    keep_clear = player.rect.inflate(2 * tile, 2 * tile)
+    added = 0
+    for x, y, kind in zip((tx * tile).tolist(), (ty * tile).tolist(), kinds.tolist()):
+        name = worldgen.KIND_NAMES[kind]
+        image_path, broken_path = BLOCK_IMAGES[name]
+        # у дерева хитбокс у нижній половині картинки — малюнок піднімаємо на тайл
+        block = ColoredBlock(x, y - tile if name == "tree" else y, image_path, broken_path)
+        if block.rect.colliderect(keep_clear):
+            continue
+        if any(block.rect.colliderect(o.rect) for o in obstacles.query_rect(block.rect)):
+            continue
+        add_block(block)
+        added += 1
+    return added
+
+def spawn_enemy(attempts=20):
+    for _ in range(attempts):
+        x = random.randint(inner_x_min, inner_x_max - 30)
+        y = random.randint(inner_y_min, inner_y_max - 30)
+        enemy_rect = pygame.Rect(x, y, 30, 30)
+        if not any(enemy_rect.colliderect(rect) for _, (rect, _) in world.query("position", "ai")) and not any(enemy_rect.colliderect(o.rect) for o in obstacles.query_rect(enemy_rect)):
+            enemy = Enemy(x, y)
+            world.create(position=enemy.rect, sprite=enemy, ai=enemy, contact="enemy")
+            return True
+    return False
+
+# -------------------------------
+# Меню та пауза (витяговані функції)
+# -------------------------------
+def draw_buttons(surface, buttons, title_text=None):
+    """Універсальна функція для меню — повертає текст натиснутої кнопки або None."""
+    surface.fill((0, 0, 0))
+    if title_text:
+        title = font("big").render(title_text, True, (255, 255, 255))
+        surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 150))
+
+    mouse_pos = pygame.mouse.get_pos()
+    clicked = pygame.mouse.get_pressed()[0]
+    result = None
+
+    for text, rect in buttons:
+        color = (200, 200, 200)
+        if pygame.Rect(rect).collidepoint(mouse_pos):
+            color = (255, 255, 0)
+            if clicked:
+                result = text
+        pygame.draw.rect(surface, color, rect, border_radius=10)
+        surface.blit(font("med").render(text, True, (0, 0, 0)), (rect[0] + 30, rect[1] + 10))
+    return result
+
+def draw_menu(surface):
+    buttons = [("Почати гру", (WIDTH // 2 - 100, 250, 200, 50)), ("Вийти", (WIDTH // 2 - 100, 320, 200, 50))]
+    return draw_buttons(surface, buttons, "MENU")
+
+def draw_pause_menu(surface):
+    buttons = [
+        ("Продовжити", (WIDTH // 2 - 100, 250, 200, 50)),
+        ("Меню", (WIDTH // 2 - 100, 320, 200, 50)),
+        ("Вийти", (WIDTH // 2 - 100, 390, 200, 50))
+    ]
+    return draw_buttons(surface, buttons, "ПАУЗА")
+
+# -------------------------------
+# Стан гри і таймери
+# -------------------------------
+# Спавн рахується за ігровим годинником (а не pygame.time.set_timer), тож
+# стоїть на паузі й однаково працює у вікні та в безголовому циклі
+BLOCK_SPAWN_INTERVAL = 6000  # мс
+ENEMY_SPAWN_INTERVAL = 8000  # мс
+MINING_DURATION = 3000  # мс
+XP_PER_BLOCK = 5
+# Інструменти (клавіші 1, 2, 3): кирка ламає один блок, бур — ще й усі добувні
+# блоки в колі DRILL_RADIUS навколо цілі, ланцюг — суміжні блоки того ж типу
+TOOL_KEYS = {pygame.K_1: "pick", pygame.K_2: "drill", pygame.K_3: "chain"}
+DRILL_RADIUS = 120
+CHAIN_GAP = 12      # блоки, між якими менше пікселів, — суміжні (дерева стоять через 10px)
+CHAIN_LIMIT = 1000  # найбільше блоків за один удар ланцюгом
+AI_BUDGET_MS = 2.0      # скільки часу ШІ ворогів може забрати за тік
+INVULNERABLE_MS = 1000  # після удару ворога гравець якийсь час невразливий
+ZOOM_IN_KEYS = (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS)
+ZOOM_OUT_KEYS = (pygame.K_MINUS, pygame.K_KP_MINUS)
+
+state = GameState()
+ai_scheduler = AIScheduler(budget_ms=AI_BUDGET_MS)
+
+# Монітор пам'яті (F3 — увімкнути, F4 — знімок)
+memory = MemoryMonitor()
+
+# Телеметрія сесії для балансу (--telemetry DIR); поки не запущена, record() нічого не робить
+telemetry = Telemetry()
+EV_SESSION = telemetry.define("session", "seed", "world")
+EV_FRAME = telemetry.define("frame", "dt_ms", "work_ms", "enemies")
+EV_MINED = telemetry.define("mined", "block", "mining_ms", "level", symbols=("block",))
+EV_MINED_AREA = telemetry.define("mined_area", "block", "count", "tool", symbols=("block", "tool"))
+EV_LEVEL = telemetry.define("level", "level", "xp_needed", "sim_ms")
+EV_HURT = telemetry.define("hurt", "hp", "enemies_touching")
+EV_PICKUP = telemetry.define("pickup", "item", "count", symbols=("item",))
+EV_GAME_OVER = telemetry.define("game_over", "level", "sim_ms")
+
+PLAYER_LIGHT_RADIUS = 220
+MINING_PARTICLES_PER_MS = 0.08
+BREAK_PARTICLES = 150
+AREA_PARTICLES = 1500  # найбільше на весь удар по площі; ділиться між розбитими блоками
+MIN_BREAK_PARTICLES = 4
+
+# -------------------------------
+# Скидання стану гри
+# -------------------------------
+def reset_game_state():
+    """Нова гра; перший виклик ще й будує шари світу (див. init_layers)."""
+    # Один світ замість чотирьох груп: очищаємо і ставимо стіни та гравця
+    build_world()
+    state.reset()
+    player.is_mining = False
+    # центр гравця
+    player.rect.center = (WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
+    player.subpixel = (0.0, 0.0)
+
+    if WORLD_SEED is not None:
+        populate_world(WORLD_SEED)
+    lights.reset()
+    particles.clear()
+    ai_scheduler.clear()
+    telemetry.record(EV_SESSION, -1 if WORLD_SEED is None else WORLD_SEED, WORLD_WIDTH)
+
+# -------------------------------
+# Майнінг
+# -------------------------------
+def try_start_mining():
+    """Початок майнінгу, якщо гравець поруч з блоком (з кількох — найближчий)."""
+    # inflate дає невеликий радіус взаємодії; кандидати — з сусідніх клітинок сітки
+    reach = player.rect.inflate(20, 20)
+    near = [obj for obj in obstacles.query_rect(reach) if reach.colliderect(obj.rect) and is_minable(obj)]
+    if not near:
+        return False
+    px, py = player.rect.center
+    block = min(near, key=lambda obj: ((obj.rect.centerx - px) ** 2 + (obj.rect.centery - py) ** 2,
+                                       static_order(obj)))
+    state.mining_start_time = state.sim_time
+    state.mining_target = block.entity
+    player.is_mining = True
+    world.add(state.player_entity, "animation", (player.mining_clip, state.sim_time))
+    return True
+
+def stop_mining():
+    player.is_mining = False
+    state.mining_target = None
+    state.mining_start_time = None
+    if state.player_entity in world:
+        world.remove(state.player_entity, "animation")
+
+# -------------------------------
+# Системи (кожна обходить лише потрібні їй сутності)
+# -------------------------------
+def ai_system(dt):
+    # близькі вороги — щотіку, дальні — по черзі з dt-компенсацією, далекі сплять
+    ai_scheduler.run(((entity, enemy) for entity, (enemy,) in world.query("ai")),
+                     player.rect.center, dt, update_enemy)
+
+def update_enemy(enemy, dt):
+    enemy.update(player, obstacles, dt)
+
+def mining_system(dt=TICK_MS):
+    state.mining_progress = 0.0
+    target = state.mining_target
+    if target is None or not player.is_mining:
+        return
+    # захист: якщо блок вже був видалений або розбитий
+    if not world.has(target, "minable"):
+        stop_mining()
+        return
+    elapsed = state.sim_time - state.mining_start_time
+    block = world.get(target, "sprite")
+    color = KIND_COLORS.get(block.kind, GREY)
+    if elapsed < MINING_DURATION:
+        state.mining_progress = elapsed / MINING_DURATION
+        x, y = contact_point(block)
+        particles.emit(x, y, max(1, int(dt * MINING_PARTICLES_PER_MS)), color,
+                       speed=0.12, life_ms=400, spread=math.pi)
+        return
+
+    # розбили блок (і все, що зачепив інструмент): більше не добуваються, грає анімація поломки
+    targets = [(target, block)] + area_targets(block, state.tool)
+    break_blocks(targets)
+    stop_mining()
+    for kind, count in Counter(b.kind for _, b in targets).items():
+        drop_pickup(block, kind, count)
+
+    telemetry.record(EV_MINED, telemetry.symbol(block.kind), elapsed, state.level)
+    # решта блоків удару — по події на тип, щоб підсумки за типами сходилися
+    for kind, count in Counter(b.kind for _, b in targets[1:]).items():
+        telemetry.record(EV_MINED_AREA, telemetry.symbol(kind), count, telemetry.symbol(state.tool))
+    award_xp(XP_PER_BLOCK * len(targets))
+
+def award_xp(amount):
+    """Додає XP (ціла кількість) і піднімає рівні, скільки вистачить."""
+    state.xp += amount
+
+    # Level up — може бути одразу кілька рівнів, якщо XP велике
+    while state.xp >= state.xp_needed:
+        state.xp -= state.xp_needed
+        state.level += 1
+        state.xp_needed += 10  # кожен рівень дорожчий на 10 XP
+        telemetry.record(EV_LEVEL, state.level, state.xp_needed, state.sim_time)
+
+def is_minable(obj):
+    """Чи obj з obstacles — блок, який ще можна добути (стіни — ні)."""
+    entity = getattr(obj, "entity", None)
+    return entity is not None and world.has(entity, "minable")
+
+def area_targets(block, tool):
+    """[(сутність, блок)], які інструмент tool ламає разом з block (без нього самого)."""
+    if tool == "drill":
+        cx, cy = block.rect.center
+        reach = pygame.Rect(cx - DRILL_RADIUS, cy - DRILL_RADIUS, 2 * DRILL_RADIUS, 2 * DRILL_RADIUS)
+        found = []
+        for obj in obstacles.query_rect(reach):
+            dx, dy = obj.rect.centerx - cx, obj.rect.centery - cy
+            if obj is not block and dx * dx + dy * dy <= DRILL_RADIUS * DRILL_RADIUS and is_minable(obj):
+                found.append(obj)
+    elif tool == "chain":
+        # обхід сусідів через сітку: кожен блок ланцюга опитує лише свої клітинки
+        seen = {block}
+        frontier = [block]
+        found = []
+        while frontier and len(found) < CHAIN_LIMIT:
+            nearby = frontier.pop().rect.inflate(2 * CHAIN_GAP, 2 * CHAIN_GAP)
+            for obj in obstacles.query_rect(nearby):
+                if (obj not in seen and getattr(obj, "kind", None) == block.kind
+                        and obj.rect.colliderect(nearby) and is_minable(obj)):
+                    seen.add(obj)
+                    found.append(obj)
+                    frontier.append(obj)
+        found = found[:CHAIN_LIMIT]
+    else:
+        return []
+    # порядок з множин сітки випадковий; відсортований — однаковий щоразу
+    found.sort(key=static_order)
+    return [(obj.entity, obj) for obj in found]
+
+def break_blocks(targets):
+    """Ламає пакет [(сутність, блок)] одним проходом.
+
+    Переїзд сутностей в ECS — пакетом (world.change_many), статичний шар
+    перемальовує одну спільну область замість прямокутника на кожен блок,
+    частинок на весь пакет не більше AREA_PARTICLES.
+    """
+    if not targets:
+        return
+    animated, still = [], []
+    map_colors = {}
+    for entity, block in targets:
+        block.break_block()
+        color = map_colors.get(block.kind)
+        if color is None:
+            color = map_colors[block.kind] = minimap_color(block)
+        minimap.mark(block.rect, color)
+        (animated if block.break_clip else still).append((entity, block))
+    # не менше MIN_BREAK_PARTICLES з блока; якщо блоків забагато — сиплемо з кожного step-го
+    step = math.ceil(len(targets) * MIN_BREAK_PARTICLES / AREA_PARTICLES)
+    sources = [block for _, block in targets[::step]]
+    per_block = min(BREAK_PARTICLES, AREA_PARTICLES // len(sources))
+    particles.emit_many([block.rect.center for block in sources], per_block,
+                        [KIND_COLORS.get(block.kind, GREY) for block in sources],
+                        speed=0.25, life_ms=900)
+    bounds = [block.bounds() for _, block in targets]
+    static_layer.invalidate(bounds[0].unionall(bounds[1:]))
+    if animated:
+        world.change_many([entity for entity, _ in animated], remove=("minable",),
+                          add={"animation": [(block.break_clip, state.sim_time) for _, block in animated]})
+    if still:
+        world.change_many([entity for entity, _ in still], remove=("minable",))
+
+def contact_point(block):
+    """Точка між блоком і гравцем: туди летять крихти і падає ресурс."""
+    return ((block.rect.centerx + player.rect.centerx) // 2,
+            (block.rect.centery + player.rect.centery) // 2)
+
+def drop_pickup(block, kind=None, count=1):
+    """Ресурс падає там, куди гравець точно дістане."""
+    item = Pickup(*contact_point(block), kind or block.kind, count)
+    world.create(position=item.rect, sprite=item, pickup=item.kind, contact="pickup")
+
+# --- Обробники контактів (викликаються з contacts.step) ---
+def hurt_player():
+    if state.hp <= 0 or state.sim_time < state.invulnerable_until:
+        return
+    state.hp -= 1
+    state.invulnerable_until = state.sim_time + INVULNERABLE_MS
+    particles.emit(player.rect.centerx, player.rect.centery, 40, RED, speed=0.2, life_ms=500)
+    telemetry.record(EV_HURT, state.hp, state.enemy_contacts)
+    if state.hp <= 0:
+        state.game_over = True
+        telemetry.record(EV_GAME_OVER, state.level, state.sim_time)
+
+def on_enemy_touch(_player, _enemy):
+    state.enemy_contacts += 1
+    hurt_player()
+
+def on_enemy_release(_player, _enemy):
+    state.enemy_contacts -= 1
+
+def on_pickup(_player, item):
+    kind = world.get(item, "pickup")
+    if kind is None:
+        return
+    state.inventory[kind] = state.inventory.get(kind, 0) + world.get(item, "sprite").count
+    telemetry.record(EV_PICKUP, telemetry.symbol(kind), state.inventory[kind])
+    contacts.remove(item)
+    world.destroy(item)
+
+def on_enemy_blocked(enemy, _block):
+    world.get(enemy, "ai").obstructed += 1
+
+def on_enemy_unblocked(enemy, _block):
+    enemy_obj = world.get(enemy, "ai")
+    if enemy_obj is not None:
+        enemy_obj.obstructed -= 1
+
+contacts.on("player", "enemy", on_enemy_touch, on_enemy_release)
+contacts.on("player", "pickup", on_pickup)
+contacts.on("enemy", "block", on_enemy_blocked, on_enemy_unblocked)
+
+def contact_system():
+    contacts.step((entity, rect, layer) for entity, (rect, layer) in world.query("position", "contact"))
+    # ворог, що не відходить, б'є знову, щойно минає невразливість
+    if state.enemy_contacts > 0:
+        hurt_player()
+
+def render_system(surface, camera_x, camera_y, now, with_static=True):
+    """Малює видимі спрайти; кадр анімації рахується лише для видимих.
+
+    with_static=False — стіни й блоки без анімації вже є в static_layer.
+    """
+    # запас 50px: дерева й гравець малюються ширше за свій хитбокс
+    view = pygame.Rect(camera_x - 50, camera_y - 50, surface.get_width() + 100, surface.get_height() + 100)
+    exclude = ("animation",) if with_static else ("animation", "collider")
+    for _, (rect, sprite) in world.query("position", "sprite", exclude=exclude):
+        if view.colliderect(rect):
+            sprite.draw(surface, camera_x, camera_y)
+
+    for _, (rect, sprite, (clip, start)) in world.query("position", "sprite", "animation"):
+        if view.colliderect(rect):
+            sprite.draw(surface, camera_x, camera_y, animation.frame_at(clip, start, now))
+
+def animation_system(now):
+    """Знімає доіграні анімації; викликається до малювання кадру.
+
+    Доанімований блок того ж кадру малює static_layer у звичайному порядку,
+    а не поверх рухомих спрайтів.
+    """
+    finished = [entity for entity, ((clip, start),) in world.query("animation")
+                if animation.is_finished(clip, start, now)]
+    for entity in finished:
+        world.remove(entity, "animation")
+        if world.has(entity, "collider"):
+            static_layer.invalidate(world.get(entity, "collider").bounds())
+
+# -------------------------------
+# Статичний шар: фон, стіни, блоки
+# -------------------------------
+STATIC_MARGIN = 50  # дерево малюється на тайл вище хитбокса
+
+def static_order(obj):
+    # стабільний порядок: смуга і повний перемал мають класти картинки однаково
+    return obj.rect.bottom, obj.rect.x
+
+def paint_static(surface, area, camera_x, camera_y, zoom=1.0):
+    """Малює фон, зелену зону, стіни й блоки без анімації в area (екранні px)."""
+    surface.fill(LIGHT_BLUE, area)
+    view = zoom_view(surface, camera_x, camera_y, zoom, camera.cache)
+    view.fill(GREEN, GREEN_ZONE.move(-camera_x, -camera_y))
+    animating = {sprite for _, (sprite, _) in world.query("sprite", "animation")}
+    query = screen_to_world(area, camera_x, camera_y, zoom).inflate(0, 2 * STATIC_MARGIN)
+    for obj in sorted(obstacles.query_rect(query), key=static_order):
+        if obj not in animating:
+            obj.draw(view, camera_x, camera_y)
+
+static_layer = StaticLayer((WIDTH, HEIGHT), paint_static)
+
+# Камера із зумом (колесо миші, +/-); масштабовані спрайти — з camera.cache
+camera = Camera((WIDTH, HEIGHT))
+
+# -------------------------------
+# Гаряче перезавантаження картинок (--hot-reload)
+# -------------------------------
+def on_assets_reloaded(name, surfaces):
+    """Пікселі surfaces переписано на місці: скидаємо все, що з них зроблено."""
+    for image in surfaces:
+        camera.cache.forget(image)
+        if isinstance(gfx, TextureBackend):
+            gfx.forget(image)
+    # вицвіла копія без власного файлу — окремий Surface кожного блока
+    for _, (block,) in world.query("sprite"):
+        if isinstance(block, ColoredBlock) and block.broken_path is None and block.image_normal in surfaces:
+            block.image_broken = block.make_faded(block.image_normal)
+            if block.is_broken:
+                block.image = block.image_broken
+    static_layer.invalidate()
+
+assets_watcher = AssetWatcher(on_reload=on_assets_reloaded)
+
+# -------------------------------
+# Тік логіки гри (без подій і малювання)
+# -------------------------------
+def update_game(dt):
+    """Просуває гру на dt мс ігрового часу; спільне для вікна і безголового циклу."""
+    state.sim_time += dt
+
+    while state.sim_time >= state.next_block_spawn:
+        spawn_block()
+        state.next_block_spawn += BLOCK_SPAWN_INTERVAL
+    while state.sim_time >= state.next_enemy_spawn:
+        spawn_enemy()
+        state.next_enemy_spawn += ENEMY_SPAWN_INTERVAL
+
+    player.update(obstacles, dt)
+    ai_system(dt)
+    contact_system()
+    mining_system(dt)
+    particles.update(dt)
+
+    # Блоки не оновлюються щотіку: кадри анімації рахуються під час малювання
+
+    # світло перераховується лише коли гравець переходить в інший тайл
+    lights.set_source("player", player.rect.centerx, player.rect.centery, PLAYER_LIGHT_RADIUS)
+
+    memory.update(state.sim_time, world)
+
+# -------------------------------
+# Малювання кадру гри
+# -------------------------------
+def draw_game(surface, hud=None):
+    """Світ малюється на surface (Surface або бекенд), HUD — на hud (за замовчуванням туди ж)."""
+    if hud is None:
+        hud = surface
+    # Камера (обмежена світом); спрайти малюють у світових px, view переводить у екранні
+    camera_x, camera_y = camera.follow(player.rect.center, WORLD_WIDTH, WORLD_HEIGHT)
+    zoom = camera.zoom
+    view = camera.view(surface)
+
+    # --- Рендер ---
+    animation_system(state.sim_time)
+    if static_layer.enabled and not isinstance(surface, TextureBackend):
+        # фон, стіни й блоки — минулий кадр, зсунутий на рух камери, + відкриті смуги
+        surface.blit(static_layer.render(camera_x, camera_y, zoom), (0, 0))
+        render_system(view, camera_x, camera_y, state.sim_time, with_static=False)
+    else:
+        # текстури вже на GPU: повний перемал дешевший, ніж вивантажувати шар щокадру
+        static_layer.invalidate()
+        view.fill(LIGHT_BLUE)
+        # зелена зона
+        view.fill(GREEN, GREEN_ZONE.move(-camera_x, -camera_y))
+        # Стіни, блоки, вороги, гравець
+        render_system(view, camera_x, camera_y, state.sim_time)
+    lights.draw(surface, camera_x, camera_y, zoom)
+    # частинки штампуються в пікселі, тож ідуть на HUD-поверхню (завжди Surface)
+    particles.draw(hud, camera_x, camera_y, zoom)
+
+    # HUD: порядок зліва направо — LEVEL -> XP BAR -> HP
+    # Рівень (ліворуч)
+    level_text = font("small").render(f"LVL: {state.level}", True, (0, 0, 0))
+    hud.blit(level_text, (10, 15))
+
+    # XP бар (трохи правіше)
+    xp_progress = state.xp / state.xp_needed if state.xp_needed > 0 else 0.0
+    draw_progress_bar(hud, 90, 18, 220, 18, xp_progress, (0, 128, 255))
+    xp_text = font("small").render(f"{int(state.xp)}/{int(state.xp_needed)} XP", True, (0, 0, 0))
+    hud.blit(xp_text, (320, 15))
+
+    # HP (серця) — правіше від шкали XP
+    hearts_text = "♥" * state.hp + " " * (state.hp_max - state.hp)
+    hearts_render = font("small").render(hearts_text, True, (200, 0, 0))
+    hud.blit(hearts_render, (420, 15))
+
+    # Підібрані ресурси (під рівнем)
+    if state.inventory:
+        items = "  ".join(f"{kind} {count}" for kind, count in sorted(state.inventory.items()))
+        hud.blit(font("tiny").render(items, True, (0, 0, 0)), (10, 42))
+    # інструмент, якщо не звичайна кирка (1 — кирка, 2 — бур, 3 — ланцюг)
+    if state.tool != "pick":
+        hud.blit(font("tiny").render(state.tool, True, (0, 0, 0)), (10, 60))
+
+    # Праві іконки (не чіпаємо); картинка з кешу assets
+    icon = safe_load_image("hungry.png", (30, 30), fill_color=(200, 200, 50))
+    hud.blit(icon, (565, 10))
+    hud.blit(icon, (565, 50))
+    hud.blit(icon, (565, 90))
+    hud.blit(icon, (535, 10))
+    hud.blit(icon, (535, 50))
+    hud.blit(icon, (535, 90))
+
+    # Мінімапа ліворуч від іконок: статичний шар + точки ворогів і гравця
+    dots = [(rect.centerx, rect.centery, RED, 2) for _, (rect, _) in world.query("position", "ai")]
+    dots.append((player.rect.centerx, player.rect.centery, WHITE, 3))
+    minimap.draw(hud, MINIMAP_POS, dots)
+
+    # Майнінг прогрес бар (по центру)
+    if player.is_mining and state.mining_progress > 0:
+        draw_progress_bar(hud, WIDTH // 2 - 100, 50, 200, 20, state.mining_progress, (0, 255, 0))
+
+    # Зведення пам'яті (F3)
+    memory.draw(hud, font("tiny"), 10, 80)
+
+# -------------------------------
+# Мережа: знімок світу для клієнтів
+# -------------------------------
+NET_BLOCK_KINDS = {"tree": net.KIND_TREE, "coal": net.KIND_COAL,
+                   "iron": net.KIND_IRON, "gold": net.KIND_GOLD}
+
+def net_snapshot():
+    """({сутність: (qx, qy, вид|прапорці, w, h)}, hud) для net.GameServer."""
+    animated = {entity for entity, _ in world.query("animation")}
+    out = {}
+    for entity, (rect, sprite) in world.query("position", "sprite"):
+        sub_x, sub_y = getattr(sprite, "subpixel", (0.0, 0.0))
+        if sprite is player:
+            kind = net.KIND_PLAYER
+            if player.is_mining:
+                kind |= net.FLAG_MINING
+            if player.facing == "left":
+                kind |= net.FLAG_LEFT
+        elif isinstance(sprite, Enemy):
+            kind = net.KIND_ENEMY
+        elif isinstance(sprite, ColoredBlock):
+            kind = NET_BLOCK_KINDS.get(sprite.kind, net.KIND_WALL)
+            if sprite.is_broken:
+                kind |= net.FLAG_BROKEN
+        elif isinstance(sprite, Pickup):
+            kind = NET_BLOCK_KINDS.get(sprite.kind, net.KIND_WALL) | net.FLAG_PICKUP
+        else:
+            kind = net.KIND_WALL
+        if entity in animated:
+            kind |= net.FLAG_ANIMATING
+        out[entity] = (net.quantize(rect.x + sub_x), net.quantize(rect.y + sub_y),
+                       kind, rect.width, rect.height)
+    return out, (state.xp, state.xp_needed, state.level, state.hp)
+
+# -------------------------------
+# Основний цикл
+# -------------------------------
+def run():
+    """Гра у вікні: меню, пауза, тіки і кадри."""
+    pygame.init()
+    gfx = display()
+    if isinstance(gfx, TextureBackend):
+        camera.cache.on_evict = gfx.forget  # викинута копія — і її текстура
+    clock = pygame.time.Clock()
+    paused = False
+    in_menu = True
+    dt = TICK_MS  # тривалість попереднього кадру гри (мс)
+    while True:
+        events = pygame.event.get()
+        # картинки, змінені на диску (--hot-reload); без змін — одна перевірка черги
+        assets_watcher.apply()
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                paused = not paused
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                memory.toggle(state.sim_time)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and memory.enabled:
+                memory.snapshot()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                lights.enabled = not lights.enabled
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F6:
+                static_layer.enabled = not static_layer.enabled
+            elif event.type == pygame.MOUSEWHEEL and not in_menu:
+                if event.y > 0:
+                    camera.zoom_in()
+                elif event.y < 0:
+                    camera.zoom_out()
+            elif event.type == pygame.KEYDOWN and event.key in ZOOM_IN_KEYS:
+                camera.zoom_in()
+            elif event.type == pygame.KEYDOWN and event.key in ZOOM_OUT_KEYS:
+                camera.zoom_out()
+            elif event.type == pygame.KEYDOWN and event.key in TOOL_KEYS:
+                state.tool = TOOL_KEYS[event.key]
+            elif not paused and not in_menu:
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    # Клацання — початок майнінгу якщо гравець поруч з блоком
+                    try_start_mining()
+                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                    # скидаємо майнінг при відпусканні
+                    stop_mining()
+
+        # --- Меню ---
+        if in_menu:
+            stop_mining()
+            result = draw_menu(gfx.hud_surface(clear=False))
+            if result == "Почати гру":
+                in_menu = False
+                reset_game_state()
+            elif result == "Вийти":
+                pygame.quit()
+                sys.exit()
+            gfx.present()
+            clock.tick(FPS)
+            continue
+
+        # --- Пауза ---
+        if paused:
+            result = draw_pause_menu(gfx.hud_surface(clear=False))
+            if result == "Продовжити":
+                paused = False
+            elif result == "Меню":
+                in_menu = True
+                paused = False
+                reset_game_state()
+            elif result == "Вийти":
+                pygame.quit()
+                sys.exit()
+            gfx.present()
+            clock.tick(FPS)
+            continue
+
+        # --- Логіка гри ---
+        started = time.perf_counter()
+        update_game(dt)
+        if state.game_over:
+            # HP скінчилось — назад у меню
+            in_menu = True
+            reset_game_state()
+            continue
+        draw_game(gfx, gfx.hud_surface())
+
+        gfx.present()
+        telemetry.record(EV_FRAME, dt, (time.perf_counter() - started) * 1000, world.count("ai"))
+        dt = min(clock.tick(FPS), MAX_DT)
+
+
+# -------------------------------
+# Сервер і клієнт-глядач
+# -------------------------------
+def serve(host="127.0.0.1", port=7777):
+    """Безголова симуляція, яка розсилає знімки клієнтам (--server)."""
+    if max(WORLD_WIDTH, WORLD_HEIGHT) > net.MAX_WORLD:
+        raise ValueError(f"світ {WORLD_WIDTH}px не влазить у формат знімків (до {net.MAX_WORLD}px)")
+    def step(dt):
+        started = time.perf_counter()
+        update_game(dt)
+        telemetry.record(EV_FRAME, dt, (time.perf_counter() - started) * 1000, world.count("ai"))
+        if state.game_over:
+            reset_game_state()  # на сервері гра одразу починається знову
+
+    reset_game_state()
+    server = net.GameServer(step, net_snapshot, host, port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+NET_COLORS = {
+    net.KIND_WALL: RED,
+    net.KIND_PLAYER: (100, 100, 255),
+    net.KIND_ENEMY: RED,
+    **{NET_BLOCK_KINDS[kind]: color for kind, color in KIND_COLORS.items()},
+}
+
+def watch(address):
+    """Малює стан із сервера прямокутниками; рухомі сутності інтерпольовані."""
+    host, port = address.rsplit(":", 1)
+    pygame.init()
+    gfx = display()
+    clock = pygame.time.Clock()
+    client = net.SnapshotClient((host, int(port)))
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                client.close()
+                pygame.quit()
+                sys.exit()
+        client.poll()
+        positions = client.positions()
+
+        camera_x = camera_y = 0
+        for entity, (x, y) in positions.items():
+            if client.entities[entity][2] & net.KIND_MASK == net.KIND_PLAYER:
+                camera_x, camera_y = int(x) - WIDTH // 2, int(y) - HEIGHT // 2
+
+        gfx.fill(LIGHT_BLUE)
+        for entity, (x, y) in positions.items():
+            _, _, kind, w, h = client.entities[entity]
+            color = NET_COLORS.get(kind & net.KIND_MASK, RED)
+            if kind & net.FLAG_BROKEN:
+                color = tuple(c * 3 // 5 for c in color)
+            gfx.fill(color, (int(x) - camera_x, int(y) - camera_y, w, h))
+
+        hud = gfx.hud_surface()
+        if client.hud is not None:
+            xp, xp_needed, level, hp = client.hud
+            text = font("small").render(f"LVL: {level}  {xp}/{xp_needed} XP  HP: {hp}", True, (0, 0, 0))
+            hud.blit(text, (10, 15))
+        gfx.present()
+        clock.tick(FPS)
+
+
+# -------------------------------
+# Параметри запуску
+# -------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="заповнити світ процедурно згенерованими блоками з цього зерна")
+    parser.add_argument("--world", type=int, default=1000,
+                        help="розмір квадратного світу в пікселях (за замовчуванням 1000)")
+    parser.add_argument("--renderer", choices=BACKENDS, default="surface",
+                        help="surface — програмний бліт (за замовчуванням), sdl2 — текстури SDL Renderer")
+    parser.add_argument("--server", action="store_true",
+                        help="авторитетний сервер без вікна: симуляція і розсилка знімків клієнтам")
+    parser.add_argument("--connect", metavar="HOST:PORT", default=None,
+                        help="підключитися до сервера як глядач")
+    parser.add_argument("--host", default="127.0.0.1", help="адреса сервера (за замовчуванням 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=7777, help="порт сервера (за замовчуванням 7777)")
+    parser.add_argument("--telemetry", metavar="DIR", default=None,
+                        help="писати телеметрію сесії (кадри, майнінг, рівні) у DIR/*.jsonl.gz")
+    parser.add_argument("--hot-reload", action="store_true",
+                        help="для художників: змінені на диску картинки підхоплюються без перезапуску")
+    args = parser.parse_args(argv)
+    if args.server and args.world > net.MAX_WORLD:
+        # позиції у знімках — u16 у 1/4 px; більші координати мовчки обрізалися б
+        parser.error(f"--server підтримує світ до {net.MAX_WORLD}px")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure(world=args.world, seed=args.seed, renderer=args.renderer)
+    if args.telemetry and not args.connect:
+        telemetry.start(args.telemetry)
+    if args.hot_reload and not (args.server or args.connect):
+        assets_watcher.start()
+    try:
+        if args.server:
+            serve(args.host, args.port)
+        elif args.connect:
+            watch(args.connect)
+        else:
+            run()
+    finally:
+        telemetry.close()  # дописує залишок буфера (і при виході через sys.exit)
+        assets_watcher.stop()
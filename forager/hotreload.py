@@ -0,0 +1,93 @@
+"""Гаряче перезавантаження картинок під час розробки (--hot-reload).
+
+Фоновий потік раз на interval порівнює mtime файлів, картинки з яких є в
+кеші assets, і декодує змінені PNG у нові Surface: читання з диска і
+розпакування не гальмують кадр. Головний цикл щокадру викликає apply() —
+він переписує пікселі кешованих копій на місці (assets.reload_image), тож
+живі блоки, гравець і кліпи бачать нову картинку без перезапуску, а
+on_reload скидає похідне: копії зуму, текстури, статичний шар.
+"""
+import os
+import queue
+import threading
+
+import pygame
+
+from . import assets
+
+
+class AssetWatcher:
+    def __init__(self, interval=0.5, on_reload=None, per_frame=4):
+        self.interval = interval
+        self.on_reload = on_reload       # on_reload(ім'я, [Surface]) — у головному потоці
+        self.per_frame = per_frame       # скільки картинок apply() переносить за кадр
+        self.mtimes = {}                 # ім'я файлу -> mtime_ns, який уже в кеші (None — файла немає)
+        self.loaded = queue.SimpleQueue()  # (ім'я, Surface) від потоку до apply()
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    # -------------------------------
+    # Запуск і зупинка
+    # -------------------------------
+    def start(self):
+        if self.running:
+            return
+        self.scan()  # запам'ятовуємо поточні mtime: перезавантажуються лише зміни після старту
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="asset-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    # -------------------------------
+    # Фоновий потік
+    # -------------------------------
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.scan()
+
+    def scan(self):
+        """Один прохід: змінені файли декодуються і стають у чергу; повертає їхні імена."""
+        changed = []
+        for name in sorted(assets.cached_names()):
+            path = assets.asset_path(name)
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            if name not in self.mtimes:
+                self.mtimes[name] = mtime  # щойно потрапив у кеш — завантажений таким, як є
+                continue
+            if mtime is None or mtime == self.mtimes[name]:
+                continue  # не змінився або його видалили (лишаємо стару картинку)
+            try:
+                image = pygame.image.load(path)
+            except pygame.error:
+                continue  # редактор ще пише файл — спробуємо наступного проходу
+            self.mtimes[name] = mtime
+            self.loaded.put((name, image))
+            changed.append(name)
+        return changed
+
+    # -------------------------------
+    # Головний потік
+    # -------------------------------
+    def apply(self):
+        """Переносить декодовані картинки в кеш (не більше per_frame); повертає кількість."""
+        done = 0
+        while done < self.per_frame and not self.loaded.empty():
+            name, image = self.loaded.get()
+            surfaces = assets.reload_image(name, image)
+            done += 1
+            if surfaces and self.on_reload:
+                self.on_reload(name, surfaces)
+        return done
@@ -0,0 +1,110 @@
+"""Світло і туман війни на низькороздільній сітці тайлів.
+
+Яскравість кожного тайла лежить у маленькому Surface (один піксель на
+тайл); numpy лише рахує змінений прямокутник. Коли джерело світла (зараз
+це лише гравець) переходить в інший тайл, перераховується лише прямокутник
+навколо його старої та нової позиції. На екран шар накладається одним масштабованим блітом з
+BLEND_RGBA_MULT; масштабована копія перебудовується тільки тоді, коли
+змінилося світло або камера зайшла в інший тайл.
+"""
+import math
+
+import numpy as np
+import pygame
+
+DARK = 25        # ще не бачили
+EXPLORED = 90    # бачили, але зараз не освітлено
+EXPLORE_AT = 0.35  # з якої сили світла тайл вважається розвіданим
+
+
+class LightMap:
+    def __init__(self, world_width, world_height, tile=50):
+        self.tile = tile
+        self.cols = -(-world_width // tile)
+        self.rows = -(-world_height // tile)
+        self.enabled = True
+        self.surface = pygame.Surface((self.cols, self.rows), 0, 32)
+        self.sources = {}      # ключ -> (tx, ty, радіус у пікселях)
+        self.version = 0       # росте з кожною зміною світла
+        self._scaled = None
+        self._scaled_key = None
+        self.reset()
+
+    def reset(self):
+        """Усе темне й нерозвідане, джерел немає."""
+        self.explored = np.zeros((self.cols, self.rows), dtype=bool)
+        self.sources.clear()
+        self.surface.fill((DARK, DARK, DARK))
+        self.version += 1
+
+    # -------------------------------
+    # Джерела світла
+    # -------------------------------
+    def set_source(self, key, x, y, radius):
+        """Ставить або рухає джерело; перерахунок — лише якщо змінився тайл."""
+        source = (int(x) // self.tile, int(y) // self.tile, radius)
+        old = self.sources.get(key)
+        if old == source:
+            return
+        self.sources[key] = source
+        if old is not None:
+            self._relight(self._bounds(old))
+        self._relight(self._bounds(source))
+
+    def _bounds(self, source):
+        tx, ty, radius = source
+        r = -(-radius // self.tile)
+        return (max(0, tx - r), max(0, ty - r),
+                min(self.cols, tx + r + 1), min(self.rows, ty + r + 1))
+
+    def _relight(self, bounds):
+        x0, y0, x1, y1 = bounds
+        if x0 >= x1 or y0 >= y1:
+            return
+        tile = self.tile
+        xs = (np.arange(x0, x1, dtype=np.float32) * tile)[:, None]
+        ys = (np.arange(y0, y1, dtype=np.float32) * tile)[None, :]
+        lit = np.zeros((x1 - x0, y1 - y0), dtype=np.float32)
+        for source in self.sources.values():
+            sx0, sy0, sx1, sy1 = self._bounds(source)
+            if sx1 <= x0 or sx0 >= x1 or sy1 <= y0 or sy0 >= y1:
+                continue
+            tx, ty, radius = source
+            dist = np.hypot(xs - tx * tile, ys - ty * tile)
+            np.maximum(lit, 1.0 - dist / radius, out=lit)
+
+        explored = self.explored[x0:x1, y0:y1]
+        explored |= lit >= EXPLORE_AT
+        value = np.maximum(np.where(explored, EXPLORED, DARK),
+                           np.clip(lit, 0.0, 1.0) * 255).astype(np.uint8)
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        pixels[x0:x1, y0:y1] = value[..., None]
+        del pixels  # знімаємо блокування Surface
+        self.version += 1
+
+    # -------------------------------
+    # Малювання
+    # -------------------------------
+    def draw(self, surface, camera_x, camera_y, zoom=1.0):
+        """Затемнює кадр: один бліт масштабованого шару з BLEND_RGBA_MULT."""
+        if not self.enabled:
+            return
+        tile = self.tile
+        step = tile * zoom  # екранних пікселів на тайл
+        tx, ty = camera_x // tile, camera_y // tile
+        key = (tx, ty, self.version, surface.get_size(), zoom)
+        if key != self._scaled_key:
+            area = pygame.Rect(tx, ty, math.ceil(surface.get_width() / step) + 2,
+                               math.ceil(surface.get_height() / step) + 2).clip(self.surface.get_rect())
+            part = self.surface.subsurface(area)
+            if self._scaled is not None and hasattr(surface, "forget"):
+                surface.forget(self._scaled)  # стара текстура бекенду sdl2
+            self._scaled = pygame.transform.smoothscale(
+                part, (math.ceil(area.width * step), math.ceil(area.height * step)))
+            self._scaled_origin = (area.x * tile, area.y * tile)
+            self._scaled_key = key
+        ox, oy = self._scaled_origin
+        x = math.floor(ox * zoom) - math.floor(camera_x * zoom)
+        y = math.floor(oy * zoom) - math.floor(camera_y * zoom)
+        surface.blit(self._scaled, (x, y), special_flags=pygame.BLEND_RGBA_MULT)
@@ -0,0 +1,131 @@
+"""Інструментування пам'яті для довгих сесій.
+
+F3 у грі вмикає монітор (tracemalloc + лічильники), F4 — знімок із
+різницею від попереднього. Звичайна гра нічого за це не платить: поки
+монітор вимкнено, update() одразу повертається. Періодичний замір теж
+дешевий (traced-байти і лічильники світу); обхід gc за Surface і знімок
+tracemalloc тривають сотні мілісекунд, тож робляться лише на F4.
+"""
+import gc
+import tracemalloc
+from collections import deque
+
+import pygame
+
+
+def surface_stats():
+    """Живі Surface, досяжні з Python-об'єктів: (кількість, байтів пікселів).
+
+    Surface не відстежуються gc, тож шукаємо їх серед посилань відстежуваних
+    об'єктів. Subsurface ділить пікселі з батьком і в байти не додається.
+    """
+    seen = {}
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface):
+                seen[id(ref)] = ref
+    pixel_bytes = sum(s.get_pitch() * s.get_height()
+                      for s in seen.values() if s.get_parent() is None)
+    return len(seen), pixel_bytes
+
+
+class MemoryMonitor:
+    """Періодичні заміри пам'яті та знімки tracemalloc."""
+
+    def __init__(self, interval_ms=5000, top=5, history=720):
+        self.interval_ms = interval_ms
+        self.top = top
+        self.enabled = False
+        self.next_sample = 0
+        self.stats = {}
+        self.history = deque(maxlen=history)   # (час, traced байт) — для тренду в lines()
+        self.top_lines = []
+        self._snapshot = None
+        self._tracing = False   # чи tracemalloc запустив саме монітор
+
+    def toggle(self, now=0):
+        self.enabled = not self.enabled
+        if self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            self.next_sample = now
+        else:
+            # чуже трасування (python -X tracemalloc, soak.py) не зупиняємо
+            if self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+            self._snapshot = None
+            self.top_lines = []
+            self.stats = {}
+            self.history.clear()
+
+    def update(self, now, world):
+        """Знімає заміри, якщо монітор увімкнено і настав час."""
+        if not self.enabled or now < self.next_sample:
+            return
+        self.next_sample = now + self.interval_ms
+        self.sample(now, world)
+
+    def sample(self, now, world):
+        """Дешеві заміри (world: ecs.World); повертає словник замірів."""
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        components = sum(len(arch) * len(arch.signature) for arch in world.archetypes.values())
+        self.stats.update({
+            "traced": current,
+            "peak": peak,
+            "entities": len(world),
+            "components": components,
+            "archetypes": len(world.archetypes),
+        })
+        self.history.append((now, current))
+        return self.stats
+
+    def snapshot(self):
+        """Повний замір (F4): Surface і знімок tracemalloc; у top_lines — прирости з минулого."""
+        self.stats["surfaces"], self.stats["pixel_bytes"] = surface_stats()
+        if not tracemalloc.is_tracing():
+            return []
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            # сам фільтр знімка компілює шаблони — це не наша пам'ять
+            tracemalloc.Filter(False, "*/fnmatch.py"),
+            tracemalloc.Filter(False, "*/re/*"),
+        ))
+        if self._snapshot is not None:
+            diff = snap.compare_to(self._snapshot, "lineno")[:self.top]
+            self.top_lines = [f"{d.size_diff / 1024:+.1f} KiB {d.traceback[0].filename.split('/')[-1]}:{d.traceback[0].lineno}"
+                              for d in diff]
+        self._snapshot = snap
+        return self.top_lines
+
+    def trend(self):
+        """Ріст traced-пам'яті за історію замірів, байт за хвилину гри (None — замало замірів)."""
+        if len(self.history) < 2:
+            return None
+        (t0, first), (t1, last) = self.history[0], self.history[-1]
+        return (last - first) * 60000 / (t1 - t0) if t1 > t0 else None
+
+    def lines(self):
+        """Текст для екранного зведення."""
+        if "traced" not in self.stats:
+            return ["MEM: збір даних..."]
+        s = self.stats
+        trend = self.trend()
+        out = [
+            f"traced {s['traced'] / 1048576:.1f} MiB (peak {s['peak'] / 1048576:.1f})"
+            + ("" if trend is None else f"  {trend / 1024:+.1f} KiB/хв"),
+            f"entities {s['entities']}  components {s['components']}  archetypes {s['archetypes']}",
+        ]
+        if "surfaces" in s:
+            out.append(f"surfaces {s['surfaces']}  pixels {s['pixel_bytes'] / 1048576:.1f} MiB (F4)")
+        return out + self.top_lines
+
+    def draw(self, surface, font, x, y):
+        if not self.enabled:
+            return
+        for line in self.lines():
+            text = font.render(line, True, (255, 255, 255), (0, 0, 0))
+            surface.blit(text, (x, y))
+            y += text.get_height()
@@ -0,0 +1,52 @@
+"""Мінімапа всього світу для HUD.
+
+Статичне (стіни, блоки) малюється в маленький Surface лише тоді, коли щось
+змінюється: блок з'явився або розбився (розбиті блоки лишаються у світі,
+тож їх просто перефарбовують). Щокадру на HUD іде один бліт
+цього шару і кілька точок для рухомих сутностей, тож ціна не залежить від
+кількості блоків.
+"""
+import pygame
+
+
+class Minimap:
+    def __init__(self, world_width, world_height, size=(100, 100),
+                 background=(20, 60, 20), border=(0, 0, 0)):
+        self.size = size
+        self.scale_x = size[0] / world_width
+        self.scale_y = size[1] / world_height
+        self.background = background
+        self.border = border
+        self.base = pygame.Surface(size)
+        self.clear()
+
+    def clear(self):
+        self.base.fill(self.background)
+
+    def _to_map(self, rect):
+        # навіть найменший блок лишається видимим — щонайменше 1 піксель
+        x = int(rect.x * self.scale_x)
+        y = int(rect.y * self.scale_y)
+        w = max(1, int(rect.right * self.scale_x) - x)
+        h = max(1, int(rect.bottom * self.scale_y) - y)
+        return x, y, w, h
+
+    # -------------------------------
+    # Зміни статичного шару
+    # -------------------------------
+    def mark(self, rect, color):
+        """Малює статичний об'єкт (стіну, блок) кольором color."""
+        self.base.fill(color, self._to_map(rect))
+
+    # -------------------------------
+    # Малювання
+    # -------------------------------
+    def draw(self, surface, pos, dots=()):
+        """Бліт статичного шару в pos і точки (x, y, колір, розмір) у світових px."""
+        ox, oy = pos
+        surface.blit(self.base, pos)
+        for x, y, color, size in dots:
+            half = size // 2
+            surface.fill(color, (ox + int(x * self.scale_x) - half,
+                                 oy + int(y * self.scale_y) - half, size, size))
+        pygame.draw.rect(surface, self.border, (ox - 1, oy - 1, self.size[0] + 2, self.size[1] + 2), 1)
@@ -0,0 +1,65 @@
+"""Кеш масштабованих копій спрайтів для дискретних рівнів зуму.
+
+Копія (спрайт, зум) будується при першому зверненні і далі лише береться
+з кешу, тож кадр зі зумом не масштабує жодного спрайта. Кеш обмежений за
+байтами пікселів: найдавніше використані копії викидаються (LRU).
+Зменшення — smoothscale (усереднення, як у мип-рівнях), збільшення —
+scale (чіткі пікселі).
+"""
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+def scaled_size(size, zoom):
+    """Розмір копії: округлення вгору, щоб сусідні тайли не розходилися щілинами."""
+    return max(1, math.ceil(size[0] * zoom)), max(1, math.ceil(size[1] * zoom))
+
+
+class MipCache:
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()   # (Surface, зум) -> (копія, байти); Surface хешується за ідентичністю
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self.on_evict = None           # on_evict(копія), напр. TextureBackend.forget
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, image, zoom):
+        """Копія image для зуму zoom; при zoom == 1 — сам image."""
+        if zoom == 1:
+            return image
+        key = (image, zoom)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        size = scaled_size(image.get_size(), zoom)
+        if zoom < 1 and image.get_bitsize() in (24, 32):
+            scaled = pygame.transform.smoothscale(image, size)
+        else:
+            scaled = pygame.transform.scale(image, size)
+        nbytes = size[0] * size[1] * scaled.get_bytesize()
+        self.entries[key] = (scaled, nbytes)
+        self.bytes += nbytes
+        while self.bytes > self.max_bytes and self.entries:
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+        return scaled
+
+    def _drop(self, key):
+        scaled, nbytes = self.entries.pop(key)
+        self.bytes -= nbytes
+        if self.on_evict:
+            self.on_evict(scaled)
+
+    def forget(self, image):
+        """Викидає копії image всіх зумів (його пікселі змінилися)."""
+        for key in [key for key in self.entries if key[0] is image]:
+            self._drop(key)
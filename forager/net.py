@@ -0,0 +1,314 @@
+"""Авторитетний сервер гри і клієнт-спостерігач (TCP, localhost або LAN).
+
+Сервер крутить симуляцію без вікна і щотіку розсилає дельта-знімки:
+лише сутності, що змінилися, з квантованими позиціями та бітовими
+прапорцями. Дельта рахується один раз за тік відносно попереднього тіку і
+ті самі байти йдуть усім клієнтам; новий клієнт спершу отримує повний знімок
+(дельту від порожнього стану). TCP гарантує порядок, тож окремі
+підтвердження баз не потрібні.
+
+Формат кадру: u32 довжина + повідомлення
+  заголовок  <B тип, I тік, I змінених, I видалених, B є_HUD>
+  [HUD]      <H xp, H xp_needed, H level, B hp>
+  змінені    <I id, B маска> + поля за маскою:
+             X/Y        — <H> абсолютна позиція в 1/4 px (тож світ до MAX_WORLD px)
+             SMALL      — <bb> зсув x/y в 1/4 px замість X/Y
+             KIND       — <B вид|прапорці, H w, H h>
+  видалені   <I id> ...
+"""
+import socket
+import struct
+import time
+
+QUANT = 4                 # позиції передаємо з точністю 1/4 px
+MAX_WORLD = 0xFFFF // QUANT  # найбільша координата, що влазить у <H>; більший світ сервер не приймає
+MSG_SNAPSHOT = 1
+
+# Вид сутності (молодші 3 біти) і прапорці (старші 5 бітів)
+KIND_WALL, KIND_PLAYER, KIND_ENEMY, KIND_TREE, KIND_COAL, KIND_IRON, KIND_GOLD = range(1, 8)
+KIND_MASK = 0x07
+FLAG_BROKEN = 0x08
+FLAG_MINING = 0x10
+FLAG_LEFT = 0x20
+FLAG_ANIMATING = 0x40
+FLAG_PICKUP = 0x80        # предмет на землі; вид — тип ресурсу
+
+MASK_X, MASK_Y, MASK_KIND, MASK_SMALL = 0x01, 0x02, 0x04, 0x08
+
+FRAME = struct.Struct("<I")
+HEADER = struct.Struct("<BIIIB")
+HUD = struct.Struct("<HHHB")
+ENTITY = struct.Struct("<IB")
+U16 = struct.Struct("<H")
+SMALL = struct.Struct("<bb")
+KIND = struct.Struct("<BHH")
+ENTITY_ID = struct.Struct("<I")
+
+MAX_BACKLOG = 4 * 1024 * 1024   # клієнт, що не встигає читати, відключається
+
+
+def quantize(value):
+    return max(0, min(0xFFFF, int(round(value * QUANT))))
+
+
+# -------------------------------
+# Кодування / декодування
+# -------------------------------
+def encode_delta(tick, prev, cur, prev_hud=None, hud=None):
+    """Дельта між знімками {id: (qx, qy, kind, w, h)}; повертає bytes повідомлення."""
+    body = bytearray()
+    changed = 0
+    for entity, record in cur.items():
+        old = prev.get(entity)
+        if old == record:
+            continue
+        qx, qy, kind, w, h = record
+        mask = 0
+        if old is None or old[2:] != record[2:]:
+            mask |= MASK_KIND
+        if old is not None and abs(qx - old[0]) < 128 and abs(qy - old[1]) < 128:
+            if qx != old[0] or qy != old[1]:
+                mask |= MASK_SMALL
+        else:
+            if old is None or qx != old[0]:
+                mask |= MASK_X
+            if old is None or qy != old[1]:
+                mask |= MASK_Y
+        body += ENTITY.pack(entity, mask)
+        if mask & MASK_SMALL:
+            body += SMALL.pack(qx - old[0], qy - old[1])
+        if mask & MASK_X:
+            body += U16.pack(qx)
+        if mask & MASK_Y:
+            body += U16.pack(qy)
+        if mask & MASK_KIND:
+            body += KIND.pack(kind, w, h)
+        changed += 1
+
+    removed = [entity for entity in prev if entity not in cur]
+    for entity in removed:
+        body += ENTITY_ID.pack(entity)
+
+    send_hud = hud is not None and hud != prev_hud
+    out = bytearray(HEADER.pack(MSG_SNAPSHOT, tick, changed, len(removed), send_hud))
+    if send_hud:
+        out += HUD.pack(*hud)
+    out += body
+    return bytes(out)
+
+
+def decode_delta(payload, entities, moved=None):
+    """Застосовує повідомлення до entities {id: [qx, qy, kind, w, h]}.
+
+    Якщо передано moved, туди пишуться попередні (qx, qy) зрушених сутностей.
+    Повертає (tick, змінені id, видалені id, hud або None).
+    """
+    kind_, tick, changed, removed, has_hud = HEADER.unpack_from(payload, 0)
+    offset = HEADER.size
+    hud = None
+    if has_hud:
+        hud = HUD.unpack_from(payload, offset)
+        offset += HUD.size
+    changed_ids = []
+    for _ in range(changed):
+        entity, mask = ENTITY.unpack_from(payload, offset)
+        offset += ENTITY.size
+        record = entities.get(entity)
+        if record is None:
+            record = entities[entity] = [0, 0, 0, 0, 0]
+        elif moved is not None and mask & (MASK_SMALL | MASK_X | MASK_Y):
+            moved[entity] = (record[0], record[1])
+        if mask & MASK_SMALL:
+            dx, dy = SMALL.unpack_from(payload, offset)
+            offset += SMALL.size
+            record[0] += dx
+            record[1] += dy
+        if mask & MASK_X:
+            record[0], = U16.unpack_from(payload, offset)
+            offset += U16.size
+        if mask & MASK_Y:
+            record[1], = U16.unpack_from(payload, offset)
+            offset += U16.size
+        if mask & MASK_KIND:
+            record[2], record[3], record[4] = KIND.unpack_from(payload, offset)
+            offset += KIND.size
+        changed_ids.append(entity)
+    removed_ids = []
+    for _ in range(removed):
+        entity, = ENTITY_ID.unpack_from(payload, offset)
+        offset += ENTITY_ID.size
+        entities.pop(entity, None)
+        removed_ids.append(entity)
+    return tick, changed_ids, removed_ids, hud
+
+
+# -------------------------------
+# Сервер
+# -------------------------------
+class _Connection:
+    __slots__ = ("sock", "outbuf", "synced")
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.outbuf = bytearray()
+        self.synced = False   # чи вже отримав повний знімок
+
+
+class GameServer:
+    """step(dt) просуває гру; snapshot() -> ({id: (qx, qy, kind, w, h)}, hud)."""
+
+    def __init__(self, step, snapshot, host="127.0.0.1", port=7777, tick_ms=1000 / 30):
+        self.step = step
+        self.snapshot = snapshot
+        self.tick_ms = tick_ms
+        self.tick_no = 0
+        self.listener = socket.create_server((host, port))
+        self.listener.setblocking(False)
+        self.clients = []
+        self.last_state = {}
+        self.last_hud = None
+        # статистика для навантажувального тесту
+        self.sim_seconds = 0.0
+        self.net_seconds = 0.0
+        self.bytes_sent = 0
+
+    @property
+    def address(self):
+        return self.listener.getsockname()[:2]
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self.listener.accept()
+            except BlockingIOError:
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.clients.append(_Connection(sock))
+
+    def _send(self, conn, frame):
+        conn.outbuf += frame
+        try:
+            sent = conn.sock.send(conn.outbuf)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._drop(conn)
+            return
+        self.bytes_sent += sent
+        del conn.outbuf[:sent]
+        if len(conn.outbuf) > MAX_BACKLOG:
+            self._drop(conn)
+
+    def _drop(self, conn):
+        if conn in self.clients:
+            self.clients.remove(conn)
+        conn.sock.close()
+
+    def tick(self):
+        """Один тік: симуляція, знімок, розсилка дельти."""
+        t0 = time.perf_counter()
+        self.step(self.tick_ms)
+        t1 = time.perf_counter()
+
+        self._accept()
+        self.tick_no += 1
+        state, hud = self.snapshot()
+        delta = None
+        for conn in list(self.clients):
+            if conn.synced:
+                if delta is None:
+                    payload = encode_delta(self.tick_no, self.last_state, state, self.last_hud, hud)
+                    delta = FRAME.pack(len(payload)) + payload
+                self._send(conn, delta)
+            else:
+                payload = encode_delta(self.tick_no, {}, state, None, hud)
+                self._send(conn, FRAME.pack(len(payload)) + payload)
+                conn.synced = True
+        self.last_state, self.last_hud = state, hud
+
+        self.sim_seconds += t1 - t0
+        self.net_seconds += time.perf_counter() - t1
+
+    def serve_forever(self):
+        print(f"Сервер слухає {self.address[0]}:{self.address[1]}, тік {self.tick_ms:.1f} мс")
+        next_tick = time.perf_counter()
+        while True:
+            self.tick()
+            next_tick += self.tick_ms / 1000
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()  # не встигаємо — не накопичуємо борг
+
+    def close(self):
+        for conn in list(self.clients):
+            self._drop(conn)
+        self.listener.close()
+
+
+# -------------------------------
+# Клієнт
+# -------------------------------
+class SnapshotClient:
+    """Отримує дельти й інтерполює рухомі сутності між двома останніми тіками."""
+
+    def __init__(self, address, tick_ms=1000 / 30):
+        self.sock = socket.create_connection(address)
+        self.sock.setblocking(False)
+        self.tick_ms = tick_ms
+        self.inbuf = bytearray()
+        self.entities = {}      # id -> [qx, qy, kind, w, h]
+        self.previous = {}      # id -> (qx, qy) до останнього знімка (лише рухомі)
+        self.hud = None
+        self.tick = 0
+        self.received_at = 0.0
+        self.bytes_received = 0
+
+    def poll(self):
+        """Читає все, що прийшло; повертає кількість застосованих знімків."""
+        while True:
+            try:
+                chunk = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                raise ConnectionError("сервер закрив з'єднання")
+            self.inbuf += chunk
+            self.bytes_received += len(chunk)
+        applied = 0
+        while len(self.inbuf) >= FRAME.size:
+            size, = FRAME.unpack_from(self.inbuf, 0)
+            if len(self.inbuf) < FRAME.size + size:
+                break
+            payload = bytes(self.inbuf[FRAME.size:FRAME.size + size])
+            del self.inbuf[:FRAME.size + size]
+            self._apply(payload)
+            applied += 1
+        return applied
+
+    def _apply(self, payload):
+        # Інтерполюємо лише те, що зрушило в цьому знімку; решта стоїть
+        moved = {}
+        self.tick, _changed, _removed, hud = decode_delta(payload, self.entities, moved)
+        self.previous = moved
+        if hud is not None:
+            self.hud = hud
+        self.received_at = time.perf_counter()
+
+    def positions(self, now=None):
+        """{id: (x, y)} у пікселях, рухомі — інтерпольовані між тіками."""
+        now = time.perf_counter() if now is None else now
+        alpha = min(1.0, max(0.0, (now - self.received_at) * 1000 / self.tick_ms))
+        out = {}
+        for entity, (qx, qy, *_rest) in self.entities.items():
+            prev = self.previous.get(entity)
+            if prev is not None:
+                qx = prev[0] + (qx - prev[0]) * alpha
+                qy = prev[1] + (qy - prev[1]) * alpha
+            out[entity] = (qx / QUANT, qy / QUANT)
+        return out
+
+    def close(self):
+        self.sock.close()
@@ -0,0 +1,182 @@
+"""Частинки: пул фіксованого розміру в масивах numpy.
+
+Живі частинки щільно лежать у [0, count) масивів позицій, швидкостей,
+залишку життя і кольору. Інтеграція, відсікання мертвих і видимих — цілими
+масивами; мертві відкидаються стисненням у заздалегідь виділені буфери, тож
+у циклі кадру немає ні Python-об'єктів на частинку, ні нових масивів.
+Малюються частинки квадратиками прямо в пікселі поверхні (surfarray).
+"""
+import math
+
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    def __init__(self, capacity=32768, gravity=0.0006, size=2):
+        self.capacity = capacity
+        self.gravity = gravity    # px/мс²
+        self.size = size          # сторона квадратика, px
+        self.count = 0
+        self.palette = []         # RGB; частинка зберігає індекс кольору
+        self._palette_index = {}
+        self._mapped = None
+        self._mapped_key = None
+        self.rng = np.random.default_rng()
+
+        c = capacity
+        self.pos = np.zeros((c, 2), np.float32)
+        self.vel = np.zeros((c, 2), np.float32)
+        self.life = np.zeros(c, np.float32)
+        self.color = np.zeros(c, np.uint16)
+        # другий комплект для стиснення + робочі буфери
+        self._pos_b = np.zeros_like(self.pos)
+        self._vel_b = np.zeros_like(self.vel)
+        self._life_b = np.zeros_like(self.life)
+        self._color_b = np.zeros_like(self.color)
+        self._step = np.zeros_like(self.pos)
+        self._mask = np.zeros(c, bool)
+        self._mask2 = np.zeros(c, bool)
+        self._ix = np.zeros(c, np.intp)
+        self._iy = np.zeros(c, np.intp)
+        self._vx = np.zeros(c, np.intp)
+        self._vy = np.zeros(c, np.intp)
+        self._vc = np.zeros(c, np.uint16)
+        self._values = np.zeros(c, np.uint32)
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def color_index(self, rgb):
+        index = self._palette_index.get(rgb)
+        if index is None:
+            index = self._palette_index[rgb] = len(self.palette)
+            self.palette.append(rgb)
+        return index
+
+    # -------------------------------
+    # Випуск
+    # -------------------------------
+    def emit(self, x, y, count, color, speed=0.15, life_ms=600,
+             direction=-math.pi / 2, spread=2 * math.pi):
+        """Випускає до count частинок з точки; повертає, скільки влізло в пул."""
+        n = min(count, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        s = slice(self.count, self.count + n)
+        rng = self.rng
+        angle = rng.uniform(direction - spread / 2, direction + spread / 2, n)
+        velocity = rng.uniform(0.3, 1.0, n) * speed
+        self.pos[s, 0] = x
+        self.pos[s, 1] = y
+        self.vel[s, 0] = np.cos(angle) * velocity
+        self.vel[s, 1] = np.sin(angle) * velocity
+        self.life[s] = rng.uniform(0.5, 1.0, n) * life_ms
+        self.color[s] = self.color_index(color)
+        self.count += n
+        return n
+
+    def emit_many(self, points, count, colors, speed=0.15, life_ms=600,
+                  direction=-math.pi / 2, spread=2 * math.pi):
+        """По count частинок з кожної точки points (кольори — colors) одним викликом."""
+        n = min(count * len(points), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        s = slice(self.count, self.count + n)
+        rng = self.rng
+        angle = rng.uniform(direction - spread / 2, direction + spread / 2, n)
+        velocity = rng.uniform(0.3, 1.0, n) * speed
+        self.pos[s] = np.repeat(np.asarray(points, np.float32), count, axis=0)[:n]
+        self.vel[s, 0] = np.cos(angle) * velocity
+        self.vel[s, 1] = np.sin(angle) * velocity
+        self.life[s] = rng.uniform(0.5, 1.0, n) * life_ms
+        indices = np.array([self.color_index(color) for color in colors], np.uint16)
+        self.color[s] = np.repeat(indices, count)[:n]
+        self.count += n
+        return n
+
+    # -------------------------------
+    # Тік
+    # -------------------------------
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+        pos, vel, life = self.pos[:n], self.vel[:n], self.life[:n]
+        vel[:, 1] += self.gravity * dt
+        step = np.multiply(vel, dt, out=self._step[:n])
+        pos += step
+        life -= dt
+
+        alive = np.greater(life, 0, out=self._mask[:n])
+        k = int(np.count_nonzero(alive))
+        if k == n:
+            return
+        np.compress(alive, pos, axis=0, out=self._pos_b[:k])
+        np.compress(alive, vel, axis=0, out=self._vel_b[:k])
+        np.compress(alive, life, out=self._life_b[:k])
+        np.compress(alive, self.color[:n], out=self._color_b[:k])
+        self.pos, self._pos_b = self._pos_b, self.pos
+        self.vel, self._vel_b = self._vel_b, self.vel
+        self.life, self._life_b = self._life_b, self.life
+        self.color, self._color_b = self._color_b, self.color
+        self.count = k
+
+    # -------------------------------
+    # Малювання
+    # -------------------------------
+    def _mapped_palette(self, surface):
+        key = (surface.get_bitsize(), surface.get_masks(), len(self.palette))
+        if key != self._mapped_key:
+            # map_rgb для поверхонь з альфою повертає знакове число — беремо біти як є
+            self._mapped = np.array([surface.map_rgb(c) & 0xFFFFFFFF for c in self.palette], np.uint32)
+            self._mapped_key = key
+        return self._mapped
+
+    def draw(self, surface, camera_x, camera_y, zoom=1.0):
+        """Штампує видимі частинки в пікселі surface (pygame.Surface, 32 біти).
+
+        При зумі позиції масштабуються, а квадратики лишаються size px.
+        """
+        n = self.count
+        if not n:
+            return
+        size = self.size
+        width, height = surface.get_size()
+        ix, iy = self._ix[:n], self._iy[:n]
+        pos = self.pos[:n]
+        if zoom != 1:
+            pos = np.multiply(pos, zoom, out=self._step[:n])
+            camera_x, camera_y = math.floor(camera_x * zoom), math.floor(camera_y * zoom)
+        np.copyto(ix, pos[:, 0], casting="unsafe")
+        np.copyto(iy, pos[:, 1], casting="unsafe")
+        ix -= camera_x
+        iy -= camera_y
+
+        visible, tmp = self._mask[:n], self._mask2[:n]
+        np.greater_equal(ix, 0, out=visible)
+        np.less(ix, width - size, out=tmp)
+        visible &= tmp
+        np.greater_equal(iy, 0, out=tmp)
+        visible &= tmp
+        np.less(iy, height - size, out=tmp)
+        visible &= tmp
+        k = int(np.count_nonzero(visible))
+        if not k:
+            return
+        vx = np.compress(visible, ix, out=self._vx[:k])
+        vy = np.compress(visible, iy, out=self._vy[:k])
+        vc = np.compress(visible, self.color[:n], out=self._vc[:k])
+        values = np.take(self._mapped_palette(surface), vc, out=self._values[:k])
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        for _ in range(size):
+            for _ in range(size):
+                pixels[vx, vy] = values
+                vy += 1
+            vy -= size
+            vx += 1
+        del pixels  # знімаємо блокування Surface
@@ -0,0 +1,123 @@
+"""Бекенди малювання: звичайний Surface або апаратні текстури pygame._sdl2.
+
+Обидва бекенди мають підмножину інтерфейсу Surface, якою користуються
+спрайти (blit, fill, get_width, get_height, get_size), тож світ малюється
+однаково. HUD і меню завжди малюються на Surface з hud_surface(): у
+текстурному режимі це прозорий шар, який вивантажується одним блітом.
+"""
+import pygame
+
+BACKENDS = ("surface", "sdl2")
+SDL_BLENDMODE_MOD = 4   # множення кольору: аналог BLEND_RGBA_MULT для текстур
+
+
+class SurfaceBackend:
+    """Програмний блітинг на поверхню з pygame.display.set_mode."""
+
+    name = "surface"
+
+    def __init__(self, size, caption):
+        self.screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(caption)
+
+    def get_size(self):
+        return self.screen.get_size()
+
+    def get_width(self):
+        return self.screen.get_width()
+
+    def get_height(self):
+        return self.screen.get_height()
+
+    def fill(self, color, rect=None):
+        self.screen.fill(color, rect)
+
+    def blit(self, image, pos, special_flags=0):
+        self.screen.blit(image, pos, special_flags=special_flags)
+
+    def hud_surface(self, clear=False):
+        return self.screen
+
+    def present(self):
+        pygame.display.flip()
+
+
+class TextureBackend:
+    """SDL Renderer: кожен спрайт вивантажується в текстуру один раз.
+
+    Працює й з програмним рендерером SDL (accelerated=0), тож його можна
+    міряти поруч із SurfaceBackend на машині без GPU.
+    """
+
+    name = "sdl2"
+
+    def __init__(self, size, caption, accelerated=-1):
+        from pygame._sdl2.video import Renderer, Texture, Window
+        self._texture_cls = Texture
+        self.window = Window(caption, size)
+        self.renderer = Renderer(self.window, accelerated=accelerated)
+        self.size = size
+        self._textures = {}    # Surface -> Texture (Surface хешується за ідентичністю)
+        self._hud = pygame.Surface(size, pygame.SRCALPHA)
+        self._hud_texture = None
+        self._hud_used = False
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def texture_for(self, image):
+        """Текстура для Surface; створюється при першому використанні."""
+        texture = self._textures.get(image)
+        if texture is None:
+            texture = self._textures[image] = self._texture_cls.from_surface(self.renderer, image)
+        return texture
+
+    def forget(self, image):
+        """Прибирає текстуру (наприклад, коли Surface перезавантажено)."""
+        self._textures.pop(image, None)
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def blit(self, image, pos, special_flags=0):
+        texture = self.texture_for(image)
+        if special_flags in (pygame.BLEND_RGBA_MULT, pygame.BLEND_RGB_MULT):
+            texture.blend_mode = SDL_BLENDMODE_MOD
+        texture.draw(dstrect=(pos[0], pos[1], texture.width, texture.height))
+
+    def hud_surface(self, clear=True):
+        """Прозорий шар поверх світу; вивантажується в present()."""
+        if clear:
+            self._hud.fill((0, 0, 0, 0))
+        self._hud_used = True
+        return self._hud
+
+    def present(self):
+        if self._hud_used:
+            if self._hud_texture is None:
+                self._hud_texture = self._texture_cls.from_surface(self.renderer, self._hud)
+            else:
+                self._hud_texture.update(self._hud)
+            self._hud_texture.draw()
+            self._hud_used = False
+        self.renderer.present()
+
+
+def create_backend(name, size, caption):
+    """Створює бекенд за назвою; якщо sdl2 недоступний — повертається до Surface."""
+    if name == "sdl2":
+        try:
+            return TextureBackend(size, caption)
+        except (ImportError, pygame.error) as exc:
+            print(f"sdl2-рендер недоступний ({exc}), використовую Surface")
+    return SurfaceBackend(size, caption)
@@ -0,0 +1,86 @@
+"""Статичний шар світу, який переживає кадр.
+
+Фон, зелена зона, стіни і блоки між кадрами майже не змінюються, тож шар
+тримає минулий кадр у власному Surface. Коли камера зсувається, вміст
+зсувається через Surface.scroll, і заново малюються лише відкриті смуги по
+краях та місця, позначені invalidate() (блок з'явився, розбився,
+доанімувався). Рухомі спрайти малюються поверх щокадру, як і раніше.
+Зміна зуму перемальовує шар повністю.
+"""
+import pygame
+
+from .camera import screen_origin, world_to_screen
+
+
+class StaticLayer:
+    def __init__(self, size, paint):
+        """paint(surface, area, camera_x, camera_y, zoom) малює статичне в area (екранні px)."""
+        self.size = size
+        self.paint = paint
+        self.surface = None
+        self.camera = None     # (x, y), для якої шар зараз намальований; None — малювати все
+        self.zoom = 1.0
+        self.dirty = []        # світові Rect, які треба перемалювати
+        self.painted = 0       # скільки пікселів перемальовано в останньому render()
+        self.enabled = True    # False — кадр щоразу малюється з нуля (F6, порівняння)
+
+    def invalidate(self, rect=None):
+        """Позначає світовий rect (або весь шар, якщо None) для перемальовування."""
+        if rect is None:
+            self.camera = None
+            self.dirty.clear()
+        elif self.camera is not None:
+            self.dirty.append(pygame.Rect(rect))
+
+    def _areas(self, camera_x, camera_y, zoom):
+        w, h = self.size
+        if self.camera is None or zoom != self.zoom:
+            return [pygame.Rect(0, 0, w, h)]
+        # зсув у екранних пікселях; при зумі 1 це просто різниця камер
+        sx, sy = screen_origin(camera_x, camera_y, zoom)
+        old_x, old_y = screen_origin(*self.camera, zoom)
+        dx, dy = sx - old_x, sy - old_y
+        if abs(dx) >= w or abs(dy) >= h:
+            return [pygame.Rect(0, 0, w, h)]
+
+        areas = []
+        if dx or dy:
+            self.surface.scroll(-dx, -dy)
+        # відкриті смуги: з того боку, куди рухається камера
+        if dx > 0:
+            areas.append(pygame.Rect(w - dx, 0, dx, h))
+        elif dx < 0:
+            areas.append(pygame.Rect(0, 0, -dx, h))
+        if dy > 0:
+            areas.append(pygame.Rect(0, h - dy, w, dy))
+        elif dy < 0:
+            areas.append(pygame.Rect(0, 0, w, -dy))
+
+        # змінене поза кадром не потрібне: його намалює смуга, коли туди дійде камера
+        screen = pygame.Rect(0, 0, w, h)
+        for rect in self.dirty:
+            clipped = world_to_screen(rect, camera_x, camera_y, zoom).clip(screen)
+            if clipped.width and clipped.height:
+                areas.append(clipped)
+        return areas
+
+    def render(self, camera_x, camera_y, zoom=1.0):
+        """Оновлює шар під камеру і зум, повертає його Surface."""
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()  # формат екрана — швидкий бліт
+        areas = self._areas(camera_x, camera_y, zoom)
+        self.dirty.clear()
+        self.camera = (camera_x, camera_y)
+        self.zoom = zoom
+
+        painted = 0
+        for area in areas:
+            # кліп: об'єкти, що стирчать за межі смуги, не перемальовують решту
+            self.surface.set_clip(area)
+            self.paint(self.surface, area, camera_x, camera_y, zoom)
+            painted += area.width * area.height
+        self.surface.set_clip(None)
+        self.painted = painted
+        return self.surface
@@ -0,0 +1,212 @@
+"""Телеметрія сесії: кільцевий буфер у пам'яті і фоновий запис у файли.
+
+Головний цикл лише кладе числа в заздалегідь виділені масиви (array),
+ніколи не чекає на диск і не блокується: якщо потік запису відстав і
+буфер повний, подія відкидається і рахується в dropped. Потік запису
+раз на flush_interval (або коли буфер наполовину заповнений) забирає
+накопичене, пише рядки JSON у gzip-файли і ротує їх за розміром, лишаючи
+не більше keep файлів. Тож і пам'ять, і місце на диску обмежені.
+
+Події описуються один раз: define("mined", "block", "mining_ms", symbols=("block",))
+повертає код для record(код, a, b, c). Рядкові значення (тип блока)
+передаються кодом з symbol() і у файлі записуються текстом.
+"""
+import gzip
+import json
+import os
+import threading
+import time
+from array import array
+
+FIELDS = 3          # чисел на подію (крім часу)
+MAX_KINDS = 64
+
+
+class Telemetry:
+    def __init__(self, capacity=8192, flush_interval=1.0, max_file_bytes=4 * 1024 * 1024,
+                 keep=8, batch=1024):
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes   # нестиснених байтів на файл до ротації
+        self.keep = keep
+        self.batch = batch
+
+        self.kinds = self.times = self.values = None   # виділяються в start()
+        self.head = 0       # скільки подій записано (лише головний потік)
+        self.tail = 0       # скільки прочитано (лише потік запису)
+        self.dropped = 0
+        self.dropped_by_kind = array("Q", bytes(8 * MAX_KINDS))
+        self.written = 0
+
+        self.schemas = []          # код -> (назва, поля, індекси полів-символів, шаблон рядка)
+        self.symbols = []          # код -> рядок
+        self._symbol_codes = {}
+        self.running = False
+        self.started = time.perf_counter()
+        self.session = None
+        self.directory = None
+        self.files = []            # шляхи файлів поточної сесії, найстаріший перший
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._file = None
+        self._file_bytes = 0
+        self._part = 0
+        self._reported_dropped = 0
+
+    # -------------------------------
+    # Опис подій
+    # -------------------------------
+    def define(self, name, *fields, symbols=()):
+        """Реєструє тип події з до FIELDS числових полів; повертає його код."""
+        assert len(fields) <= FIELDS and len(self.schemas) < MAX_KINDS
+        symbol_fields = tuple(i for i, field in enumerate(fields) if field in symbols)
+        # готовий шаблон рядка JSON: потік запису лише підставляє числа
+        template = "".join([f'{{"t":%s,"kind":{json.dumps(name)}']
+                           + [f',{json.dumps(field)}:%s' for field in fields] + ["}"])
+        self.schemas.append((name, fields, symbol_fields, template))
+        return len(self.schemas) - 1
+
+    def symbol(self, text):
+        """Код рядка для поля-символу (рядок запам'ятовується при першому виклику)."""
+        code = self._symbol_codes.get(text)
+        if code is None:
+            code = self._symbol_codes[text] = len(self.symbols)
+            self.symbols.append(text)
+        return code
+
+    # -------------------------------
+    # Головний потік
+    # -------------------------------
+    def record(self, kind, a=0.0, b=0.0, c=0.0):
+        """Кладе подію в буфер; без блокувань і нових об'єктів у пам'яті буфера."""
+        if not self.running:
+            return
+        head = self.head
+        pending = head - self.tail
+        if pending >= self.capacity:
+            self.dropped += 1
+            self.dropped_by_kind[kind] += 1
+            return
+        i = head % self.capacity
+        self.kinds[i] = kind
+        self.times[i] = time.perf_counter() - self.started
+        j = i * FIELDS
+        values = self.values
+        values[j] = a
+        values[j + 1] = b
+        values[j + 2] = c
+        self.head = head + 1  # публікуємо подію лише після запису полів
+        if pending == self.capacity // 2:
+            self._wake.set()
+
+    # -------------------------------
+    # Запуск і зупинка
+    # -------------------------------
+    def start(self, directory, prefix="telemetry"):
+        """Починає сесію: файли <prefix>-<час>-NNNN.jsonl.gz у directory."""
+        if self.running:
+            return
+        os.makedirs(directory, exist_ok=True)
+        if self.kinds is None:
+            capacity = self.capacity
+            self.kinds = array("H", bytes(2 * capacity))
+            self.times = array("d", bytes(8 * capacity))
+            self.values = array("d", bytes(8 * capacity * FIELDS))
+        self.directory = directory
+        self.session = f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}"
+        self.started = time.perf_counter()
+        self.head = self.tail = self.dropped = self.written = 0
+        self._reported_dropped = 0
+        for i in range(MAX_KINDS):
+            self.dropped_by_kind[i] = 0
+        self.files = []
+        self._part = 0
+        self._stop.clear()
+        self._open_next()
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def close(self, timeout=5.0):
+        """Зупиняє запис: дописує залишок буфера і підсумок, закриває файл."""
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    # -------------------------------
+    # Потік запису
+    # -------------------------------
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+        self._drain()
+        self._write_summary()
+        self._file.close()
+        self._file = None
+
+    def _drain(self):
+        head = self.head
+        while self.tail < head:
+            end = min(head, self.tail + self.batch)
+            lines = [self._line(i % self.capacity) for i in range(self.tail, end)]
+            self.tail = end  # слоти вільні лише після того, як їх прочитано
+            self.written += len(lines)
+            self._write(lines)
+        if self.dropped != self._reported_dropped:
+            self._reported_dropped = self.dropped
+            self._write([self._dropped_line()])
+        if self._file is not None:
+            self._file.flush()
+
+    def _line(self, i):
+        _, fields, symbol_fields, template = self.schemas[self.kinds[i]]
+        j = i * FIELDS
+        out = [round(self.times[i], 4)]
+        for k in range(len(fields)):
+            value = self.values[j + k]
+            if k in symbol_fields:
+                out.append(json.dumps(self.symbols[int(value)]))
+            elif value.is_integer():
+                out.append(int(value))
+            else:
+                out.append(round(value, 3))
+        return template % tuple(out)
+
+    def _dropped_line(self):
+        by_kind = {self.schemas[k][0]: n for k, n in enumerate(self.dropped_by_kind) if n}
+        return json.dumps({"t": round(time.perf_counter() - self.started, 4), "kind": "dropped",
+                           "total": self.dropped, "by_kind": by_kind}, separators=(",", ":"))
+
+    def _write(self, lines):
+        text = "\n".join(lines) + "\n"
+        self._file.write(text)
+        self._file_bytes += len(text)
+        if self._file_bytes >= self.max_file_bytes:
+            self._write_summary()
+            self._file.close()
+            self._open_next()
+
+    def _write_summary(self):
+        self._file.write(json.dumps({"kind": "summary", "written": self.written,
+                                     "dropped": self.dropped}) + "\n")
+
+    def _open_next(self):
+        path = os.path.join(self.directory, f"{self.session}-{self._part:04d}.jsonl.gz")
+        self._part += 1
+        self.files.append(path)
+        while len(self.files) > self.keep:
+            old = self.files.pop(0)
+            if os.path.exists(old):
+                os.remove(old)
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._file_bytes = 0
+        header = {"kind": "header", "session": self.session, "part": self._part - 1,
+                  "events": {name: list(fields) for name, fields, _, _ in self.schemas}}
+        self._file.write(json.dumps(header, separators=(",", ":")) + "\n")
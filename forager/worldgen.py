@@ -0,0 +1,98 @@
+"""Процедурна генерація світу: векторизований value noise по сітці тайлів.
+
+Шум залежить лише від зерна і цілих координат вузлів, тож сусідні області
+стикуються без швів, а той самий seed завжди дає той самий світ.
+"""
+import numpy as np
+
+TILE = 50           # розмір тайла (= розмір блока руди), px
+
+# Коди вмісту тайла (0 — порожньо)
+EMPTY, TREE, COAL, IRON, GOLD = range(5)
+KIND_NAMES = {TREE: "tree", COAL: "coal", IRON: "iron", GOLD: "gold"}
+
+# Параметри розподілу
+FOREST_SCALE = 9.0      # розмір лісових масивів, тайлів
+FOREST_LEVEL = 0.55     # поріг шуму, вище якого — ліс
+FOREST_DENSITY = 0.55   # частка зайнятих тайлів у лісі
+VEIN_SCALE = 5.0        # «товщина» рудних жил, тайлів
+VEIN_LEVEL = 0.93       # поріг гребеня жили
+ORE_SCALE = 16.0        # масштаб зон із різними рудами
+
+
+def _hash01(ix, iy, seed):
+    """Детермінований псевдовипадковий float32 у [0, 1) для цілих вузлів."""
+    h = (ix.astype(np.uint64) * np.uint64(0x9E3779B1)
+         + iy.astype(np.uint64) * np.uint64(0x85EBCA77)
+         + np.uint64(seed & 0xFFFFFFFF) * np.uint64(0xC2B2AE3D))
+    h &= np.uint64(0xFFFFFFFF)
+    h ^= h >> np.uint64(15)
+    h = (h * np.uint64(0x2C1B3C6D)) & np.uint64(0xFFFFFFFF)
+    h ^= h >> np.uint64(12)
+    h = (h * np.uint64(0x297A2D39)) & np.uint64(0xFFFFFFFF)
+    h ^= h >> np.uint64(15)
+    return (h & np.uint64(0xFFFFFF)).astype(np.float32) / np.float32(1 << 24)
+
+
+def value_noise(seed, tx0, ty0, width, height, scale, octaves=3):
+    """Фрактальний value noise у [0, 1] для тайлів [tx0, tx0+width) x [ty0, ty0+height).
+
+    Повертає масив (height, width); значення визначаються лише абсолютними
+    координатами, а не розміром/положенням вікна.
+    """
+    xs = np.arange(tx0, tx0 + width, dtype=np.float64)
+    ys = np.arange(ty0, ty0 + height, dtype=np.float64)
+    total = np.zeros((height, width), dtype=np.float32)
+    amplitude, norm = 1.0, 0.0
+    for octave in range(octaves):
+        fx = xs / scale
+        fy = ys / scale
+        ix = np.floor(fx).astype(np.int64)
+        iy = np.floor(fy).astype(np.int64)
+        # smoothstep-інтерполяція між вузлами решітки
+        ux = fx - ix
+        uy = fy - iy
+        ux = (ux * ux * (3 - 2 * ux)).astype(np.float32)[None, :]
+        uy = (uy * uy * (3 - 2 * uy)).astype(np.float32)[:, None]
+        gx, gy = np.meshgrid(ix, iy)
+        octave_seed = seed * 1013 + octave * 7919
+        v00 = _hash01(gx, gy, octave_seed)
+        v10 = _hash01(gx + 1, gy, octave_seed)
+        v01 = _hash01(gx, gy + 1, octave_seed)
+        v11 = _hash01(gx + 1, gy + 1, octave_seed)
+        top = v00 + (v10 - v00) * ux
+        bottom = v01 + (v11 - v01) * ux
+        total += amplitude * (top + (bottom - top) * uy)
+        norm += amplitude
+        amplitude *= 0.5
+        scale /= 2.0
+    return total / norm
+
+
+def classify(seed, tx0, ty0, width, height):
+    """Масив кодів вмісту (height, width) для прямокутника тайлів."""
+    forest = value_noise(seed, tx0, ty0, width, height, FOREST_SCALE)
+    # гребеневий шум: максимум уздовж «ліній» — виходять витягнуті жили
+    vein = 1.0 - np.abs(2.0 * value_noise(seed + 1, tx0, ty0, width, height, VEIN_SCALE) - 1.0)
+    ore_zone = value_noise(seed + 2, tx0, ty0, width, height, ORE_SCALE, octaves=2)
+    scatter = value_noise(seed + 3, tx0, ty0, width, height, 1.0, octaves=1)
+
+    kind = np.zeros((height, width), dtype=np.uint8)
+    kind[(forest > FOREST_LEVEL) & (scatter < FOREST_DENSITY)] = TREE
+    ore = vein > VEIN_LEVEL
+    kind[ore] = COAL
+    kind[ore & (ore_zone > 0.5)] = IRON
+    kind[ore & (ore_zone > 0.68)] = GOLD
+    return kind
+
+
+def generate_area(seed, left, top, right, bottom, tile=TILE):
+    """Тайли, що повністю лежать у піксельному прямокутнику: (tx, ty, kind)."""
+    tx0, ty0 = -(-left // tile), -(-top // tile)
+    tx1, ty1 = right // tile, bottom // tile
+    if tx1 <= tx0 or ty1 <= ty0:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty, empty, np.zeros(0, dtype=np.uint8)
+    kind = classify(seed, tx0, ty0, tx1 - tx0, ty1 - ty0)
+    ty, tx = np.nonzero(kind)
+    return (tx + tx0).astype(np.int32), (ty + ty0).astype(np.int32), kind[ty, tx]
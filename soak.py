@@ -0,0 +1,80 @@
+"""Soak-тест: безголовий цикл гри на N ігрових годин із контролем пам'яті.
+
+Запуск:  python soak.py --hours 2 [--dt 250] [--seed 42]
+
+Після прогріву пам'ять (tracemalloc), кількість Surface і байти пікселів
+мають лишатися сталими; інакше скрипт завершується з кодом 1. Кількість
+сутностей лише друкується: зона спавну заповнюється блоками поступово.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from forager import game
+from forager.memstats import surface_stats
+
+
+def measure():
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    surfaces, pixel_bytes = surface_stats()
+    return current, len(game.world), surfaces, pixel_bytes
+
+
+def soak(hours, dt, warmup=0.25, samples=12, tolerance=512 * 1024, render_every=600):
+    """Проганяє гру і повертає список замірів; кидає AssertionError при рості."""
+    total_ticks = int(hours * 3600 * 1000 / dt)
+    warmup_ticks = int(total_ticks * warmup)
+    sample_every = max(1, (total_ticks - warmup_ticks) // samples)
+    frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+
+    game.reset_game_state()
+    game.draw_game(frame)  # кеші малювання (шар світла тощо) створюються з першим кадром
+    tracemalloc.start()
+    rows = []
+    baseline = None
+    started = time.perf_counter()
+    for tick in range(1, total_ticks + 1):
+        game.update_game(dt)
+        if tick % render_every == 0:
+            game.draw_game(frame)
+        if tick == warmup_ticks:
+            baseline = measure()
+        elif baseline is not None and (tick - warmup_ticks) % sample_every == 0:
+            row = measure()
+            rows.append((game.state.sim_time / 3600000, *row))
+            print(f"{rows[-1][0]:6.2f} h  traced {row[0] / 1024:9.1f} KiB  entities {row[1]:5d}  "
+                  f"surfaces {row[2]:5d}  pixels {row[3] / 1048576:6.2f} MiB")
+    tracemalloc.stop()
+    print(f"{total_ticks} тіків за {time.perf_counter() - started:.1f} с")
+
+    final = rows[-1] if rows else (0, *measure())
+    growth = final[1] - baseline[0]
+    assert growth <= tolerance, f"пам'ять зросла на {growth / 1024:.1f} KiB після прогріву"
+    assert final[3] <= baseline[2], f"Surface стало більше: {baseline[2]} -> {final[3]}"
+    assert final[4] <= baseline[3], f"пікселів стало більше: {baseline[3]} -> {final[4]}"
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0, help="ігрових годин")
+    parser.add_argument("--dt", type=float, default=250.0, help="крок симуляції, мс")
+    parser.add_argument("--tolerance-kib", type=float, default=512.0, help="допустимий ріст пам'яті")
+    parser.add_argument("--seed", type=int, default=None, help="зерно процедурного світу")
+    parser.add_argument("--world", type=int, default=None, help="розмір світу в пікселях")
+    opts = parser.parse_args()
+    game.configure(world=opts.world, seed=opts.seed)
+    try:
+        soak(opts.hours, opts.dt, tolerance=opts.tolerance_kib * 1024)
+    except AssertionError as exc:
+        print(f"FAIL: {exc}")
+        sys.exit(1)
+    print("OK: пам'ять стабільна")
@@ -0,0 +1,579 @@
+"""Регресійні тести продуктивності гарячих шляхів.
+
+Запуск:   python -m pytest test.py
+Запис:    PERF_RECORD=1 python -m pytest test.py   (оновлює perf_baseline.json)
+Поріг:    PERF_THRESHOLD=2.0 — у скільки разів можна бути повільніше за базу
+
+Кожен замір — найкращий з кількох повторів. Він ділиться на час
+калібрувального циклу на чистому Python, тож база, записана на одній машині,
+приблизно придатна й на іншій. Якщо бази для тесту немає, тест лише друкує
+свій час.
+"""
+import gc
+import gzip
+import json
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from forager import animation, assets, game, net
+from forager.ai_lod import AIScheduler
+from forager.collision import SpatialHash, move_and_slide
+from forager.hotreload import AssetWatcher
+from forager.memstats import MemoryMonitor
+from forager.particles import ParticleSystem
+from forager.telemetry import Telemetry
+
+game.configure(world=4000)
+# як у грі: вікно (dummy) відкрите раніше, ніж вантажаться картинки, тож
+# вони конвертуються у формат екрана і блітяться швидко
+game.display()
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+RECORD = os.environ.get("PERF_RECORD") == "1"
+THRESHOLD = float(os.environ.get("PERF_THRESHOLD", "2.0"))
+
+SCENARIO_BLOCKS = 5000
+SCENARIO_ENEMIES = 500
+
+
+# -------------------------------
+# Заміри і бази
+# -------------------------------
+def _calibrate(repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        total = 0
+        for i in range(200000):
+            total += i * i
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _load_baseline():
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    return None
+
+
+@pytest.fixture(scope="module")
+def perf():
+    """check(name, seconds): порівнює з базою або запам'ятовує для запису."""
+    baseline = _load_baseline()
+    recorded = {}
+    calibrations = []
+
+    def check(name, seconds):
+        # калібруємо одразу після заміру: швидкість машини «плаває» протягом прогону
+        calibration = _calibrate()
+        calibrations.append(calibration)
+        score = seconds / calibration
+        recorded[name] = score
+        print(f"\n{name}: {seconds * 1000:.3f} ms ({score:.3f} калібрувань)")
+        if RECORD or baseline is None or name not in baseline["results"]:
+            return
+        limit = baseline["results"][name] * THRESHOLD
+        assert score <= limit, (f"{name}: {score:.3f} калібрувань, база {baseline['results'][name]:.3f} "
+                                f"(поріг x{THRESHOLD})")
+
+    yield check
+
+    if RECORD:
+        data = baseline or {"results": {}}
+        data["results"].update(recorded)
+        data["calibration_seconds"] = min(calibrations)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+def measure(fn, number=1, repeat=9, setup=None):
+    """Найкращий час одного виклику fn серед repeat серій по number викликів.
+
+    Як і timeit, на час серії вимикаємо gc: інакше повний прохід по тисячах
+    блоків випадково потрапляє в одні серії і не потрапляє в інші.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            best = min(best, (time.perf_counter() - t0) / number)
+        finally:
+            gc.enable()
+    return best
+
+
+# -------------------------------
+# Сценарії
+# -------------------------------
+def build_scenario(blocks=SCENARIO_BLOCKS, enemies=SCENARIO_ENEMIES, seed=1):
+    """Детермінований світ: blocks блоків по тайлах і enemies ворогів у вільних тайлах."""
+    random.seed(seed)
+    game.reset_game_state()
+    tile = 50
+    tiles = [(x, y) for x in range(0, game.WORLD_WIDTH, tile) for y in range(0, game.WORLD_HEIGHT, tile)]
+    random.Random(seed).shuffle(tiles)
+    keep_clear = game.GREEN_ZONE.inflate(2 * tile, 2 * tile)
+    kinds = ["coal", "iron", "gold", "tree"]
+    placed = 0
+    free = []
+    for x, y in tiles:
+        rect = pygame.Rect(x, y, tile, tile)
+        if rect.colliderect(keep_clear) or any(rect.colliderect(o.rect) for o in game.obstacles.query_rect(rect)):
+            continue
+        if placed >= blocks:
+            free.append((x, y))
+            continue
+        kind = kinds[placed % len(kinds)]
+        image_path, broken_path = game.BLOCK_IMAGES[kind]
+        game.add_block(game.ColoredBlock(x, y - tile if kind == "tree" else y, image_path, broken_path))
+        placed += 1
+    for x, y in free[:enemies]:
+        enemy = game.Enemy(x + 10, y + 10)
+        game.world.create(position=enemy.rect, sprite=enemy, ai=enemy, contact="enemy")
+    assert placed == blocks and game.world.count("ai") == min(enemies, len(free))
+
+
+def scenario_restorer():
+    """Повертає функцію, що ставить ворогів на стартові місця і скидає контакти.
+
+    Без цього кожен наступний повтор заміру бачив би інший світ: вороги
+    сходяться до гравця і контактів стає більше.
+    """
+    start = [(enemy, enemy.rect.topleft) for _, (enemy,) in game.world.query("ai")]
+
+    def restore():
+        for enemy, topleft in start:
+            enemy.rect.topleft = topleft
+            enemy.subpixel = (0.0, 0.0)
+            enemy.obstructed = 0
+        game.contacts.contacts.clear()
+        game.state.enemy_contacts = 0
+        game.state.hp = game.state.hp_max
+    return restore
+
+
+@pytest.fixture
+def scenario():
+    build_scenario()
+    yield scenario_restorer()
+    game.reset_game_state()
+
+
+# -------------------------------
+# Мікро: окремі гарячі шляхи
+# -------------------------------
+def test_worldgen_seams():
+    # той самий seed — той самий світ; дві сусідні області = одна велика, без швів
+    from forager import worldgen
+    whole = worldgen.classify(7, -64, 32, 128, 64)
+    halves = np.hstack([worldgen.classify(7, -64, 32, 64, 64), worldgen.classify(7, 0, 32, 64, 64)])
+    rows = np.vstack([worldgen.classify(7, -64, 32, 128, 40), worldgen.classify(7, -64, 72, 128, 24)])
+    assert np.array_equal(whole, halves) and np.array_equal(whole, rows)
+    assert np.array_equal(whole, worldgen.classify(7, -64, 32, 128, 64))
+    assert np.count_nonzero(whole) and not np.array_equal(whole, worldgen.classify(8, -64, 32, 128, 64))
+
+
+def test_move_and_slide():
+    # без тунелювання за будь-якого dt: крок 500px зупиняється впритул до стінки 10px
+    class Box:
+        def __init__(self, *rect):
+            self.rect = pygame.Rect(*rect)
+
+    grid = SpatialHash(64)
+    grid.insert(Box(100, -1000, 10, 2000))
+    assert move_and_slide(0, 0, 30, 30, 500, 0, grid) == (70, 0, True)
+    assert move_and_slide(200, 0, 30, 30, -500, 0, grid) == (110, 0, True)
+    # ковзання: уздовж стіни рух зберігається повністю, впоперек — гаситься
+    x, y, hit = move_and_slide(0, 0, 30, 30, 500, 200, grid)
+    assert hit and x == 70 and y == pytest.approx(200)
+    assert move_and_slide(70, 0, 30, 30, 0, 300, grid) == (70, 300, False)
+    # кут: обидві осі впираються — рух зупиняється
+    grid.insert(Box(-1000, 100, 2000, 10))
+    x, y, hit = move_and_slide(0, 0, 30, 30, 500, 400, grid)
+    assert hit and (x, y) == (70, 70)
+
+
+def test_spawn_block(perf):
+    perf("spawn_block", measure(game.spawn_block, number=200, setup=build_scenario))
+
+
+def test_player_update(perf, scenario):
+    def step():
+        game.player.update(game.obstacles, game.TICK_MS)
+        game.player.move(3.0, 2.0, game.obstacles)
+        game.player.move(-3.0, -2.0, game.obstacles)
+    perf("player_update", measure(step, number=1000))
+
+
+def test_enemy_update(perf, scenario):
+    # усі 500 без планувальника — ціна самого Enemy.update
+    enemies = [enemy for _, (enemy,) in game.world.query("ai")]
+
+    def step():
+        for enemy in enemies:
+            enemy.update(game.player, game.obstacles, game.TICK_MS)
+    perf("enemy_update_500", measure(step, number=5, setup=scenario))
+
+
+def test_ai_scheduler(perf, scenario):
+    perf("ai_system_lod_500", measure(lambda: game.ai_system(game.TICK_MS), number=5, setup=scenario))
+    stats = game.ai_scheduler.stats
+    assert stats["dormant"] > 0 and stats["updated"] < game.world.count("ai")
+
+
+def test_ai_scheduler_fairness():
+    # понад бюджет: близьких більше, ніж влазить у тік, але кожен доходить до черги
+    class Agent:
+        def __init__(self, x):
+            self.rect = pygame.Rect(x, 0, 1, 1)
+
+    def update(agent, dt):
+        updated.add(agent)
+        end = time.perf_counter() + 20e-6
+        while time.perf_counter() < end:
+            pass
+
+    agents = [(i + 1, Agent(i % 400)) for i in range(800)]
+    scheduler = AIScheduler(budget_ms=2.0)
+    updated = set()
+    for _ in range(40):
+        scheduler.run(agents, (0, 0), game.TICK_MS, update)
+    assert scheduler.stats["deferred"] > 0 and len(updated) == len(agents)
+
+
+def test_contacts(perf, scenario):
+    perf("contacts_500", measure(game.contact_system, number=5, setup=scenario))
+
+
+def test_contact_rules(monkeypatch):
+    # ворог підходить до гравця: один удар, невразливість, повторний удар, розходження
+    game.reset_game_state()
+    state, player = game.state, game.player
+    events = []
+    begin, end = game.contacts.handlers[("player", "enemy")]
+    monkeypatch.setitem(game.contacts.handlers, ("player", "enemy"),
+                        (lambda *pair: events.append("begin") or begin(*pair),
+                         lambda *pair: events.append("end") or end(*pair)))
+    enemy = game.Enemy(player.rect.x - 60, player.rect.y)
+    game.world.create(position=enemy.rect, sprite=enemy, ai=enemy, contact="enemy")
+    try:
+        for _ in range(60):
+            enemy.update(player, game.obstacles)
+            game.contact_system()
+        assert events == ["begin"] and state.hp == state.hp_max - 1
+
+        state.sim_time += game.INVULNERABLE_MS - 1
+        game.contact_system()
+        assert state.hp == state.hp_max - 1
+        state.sim_time += 1
+        game.contact_system()
+        assert events == ["begin"] and state.hp == state.hp_max - 2
+
+        enemy.rect.x -= 200
+        game.contact_system()
+        assert events == ["begin", "end"] and state.enemy_contacts == 0
+
+        # предмет під гравцем: підбирається і зникає зі світу та з контактів
+        item = game.Pickup(*player.rect.center, "coal", 3)
+        entity = game.world.create(position=item.rect, sprite=item, pickup=item.kind, contact="pickup")
+        game.contact_system()
+        assert state.inventory == {"coal": 3}
+        assert entity not in game.world and entity not in game.contacts.layers
+    finally:
+        game.reset_game_state()
+
+
+def test_block_animation(perf, scenario):
+    # ColoredBlock.update більше немає: кадр анімації рахується з годинника
+    # під час малювання, тож міряємо саме це для всіх блоків сценарію
+    clips = [block.break_clip for _, (block,) in game.world.query("collider")
+             if getattr(block, "break_clip", None)]
+
+    def frames():
+        for i, clip in enumerate(clips):
+            animation.frame_at(clip, i, 500)
+    perf("block_animation_frames", measure(frames, number=3))
+
+
+def test_particles(perf):
+    system = ParticleSystem(capacity=20000)
+    frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+
+    def step():
+        system.emit(300, 300, 400, (255, 200, 0), life_ms=800)
+        system.update(game.TICK_MS)
+        system.draw(frame, 0, 0)
+    measure(step, number=60, repeat=1)  # розгін до сталої кількості
+    perf("particles", measure(step, number=30))
+
+
+def test_light_relight():
+    # рух джерела перераховує лише старий і новий прямокутники; розвідане лишається розвіданим
+    from forager.lighting import EXPLORED, LightMap
+    lights = LightMap(1000, 1000)
+    lights.set_source("player", 100, 100, 220)
+    old = lights.sources["player"]
+    before = pygame.surfarray.array_red(lights.surface)
+    explored = lights.explored.copy()
+    lights.set_source("player", 600, 600, 220)
+
+    allowed = np.zeros_like(explored)
+    for x0, y0, x1, y1 in (lights._bounds(old), lights._bounds(lights.sources["player"])):
+        allowed[x0:x1, y0:y1] = True
+    changed = pygame.surfarray.array_red(lights.surface) != before
+    assert changed.any() and not (changed & ~allowed).any()
+    assert explored.any() and lights.explored[explored].all()
+    assert pygame.surfarray.array_red(lights.surface)[old[0], old[1]] == EXPLORED
+
+
+def test_memory_sample(perf, scenario):
+    # F3: періодичний замір щокадру не має бути помітним; повний обхід — лише на F4
+    monitor = MemoryMonitor()
+    tracemalloc.start()
+    try:
+        monitor.toggle(0)
+        seconds = measure(lambda: monitor.sample(0, game.world), number=100, repeat=3)
+        monitor.sample(60000, game.world)
+        assert monitor.trend() is not None and "KiB/хв" in monitor.lines()[0]
+        monitor.toggle()
+        assert tracemalloc.is_tracing()  # монітор не запускав трасування — і не зупиняє
+    finally:
+        tracemalloc.stop()
+    perf("memory_sample", seconds)  # калібрування — вже без трасування
+
+
+def test_telemetry_record(perf, tmp_path):
+    # потік запису спить (flush_interval), тож міряється лише запис у буфер
+    tele = Telemetry(capacity=100000, flush_interval=60)
+    frame = tele.define("frame", "dt_ms", "work_ms", "enemies")
+    mined = tele.define("mined", "block", "mining_ms", symbols=("block",))
+    tele.start(str(tmp_path))
+    try:
+        perf("telemetry_record", measure(lambda: tele.record(frame, 16.6, 3.25, 40), number=5000))
+        tele.record(mined, tele.symbol("coal"), 3000)
+    finally:
+        tele.close()
+    assert tele.dropped == 0 and tele.written == tele.head
+
+    lines = [json.loads(line) for path in tele.files for line in gzip.open(path, "rt", encoding="utf-8")]
+    assert lines[0]["kind"] == "header" and lines[-1] == {"kind": "summary", "written": tele.written, "dropped": 0}
+    assert lines[1] == {"t": lines[1]["t"], "kind": "frame", "dt_ms": 16.6, "work_ms": 3.25, "enemies": 40}
+    assert lines[-2]["block"] == "coal"
+
+
+def test_net_roundtrip():
+    # клієнт, що застосовує дельти по черзі, має бачити рівно те, що сервер
+    rng = random.Random(3)
+    top = net.quantize(net.MAX_WORLD)
+    server, client, hud = {}, {}, None
+    prev_hud = None
+    for tick in range(300):
+        prev = dict(server)
+        for entity in rng.sample(range(1, 400), 40):
+            if entity in server and rng.random() < 0.2:
+                del server[entity]
+                continue
+            qx, qy, kind, w, h = server.get(entity, (rng.randint(0, top), rng.randint(0, top), 1, 40, 40))
+            if rng.random() < 0.5:
+                qx = min(top, max(0, qx + rng.randint(-127, 127)))  # SMALL
+                qy = min(top, max(0, qy + rng.randint(-127, 127)))
+            else:
+                qx, qy = rng.randint(0, top), rng.randint(0, top)  # X/Y
+            if rng.random() < 0.1:
+                kind, w, h = rng.randint(0, 255), rng.randint(1, 400), rng.randint(1, 400)
+            server[entity] = (qx, qy, kind, w, h)
+        hud = (tick, 100, tick // 10, rng.randint(0, 100)) if tick % 7 == 0 else prev_hud
+        got_tick, _, _, got_hud = net.decode_delta(net.encode_delta(tick, prev, server, prev_hud, hud), client)
+        assert got_tick == tick and got_hud == (hud if hud != prev_hud else None)
+        assert {entity: tuple(record) for entity, record in client.items()} == server
+        prev_hud = hud
+
+    # кількості в заголовку не обрізаються на 65535
+    many = {entity: (entity % 50, 0, 1, 40, 40) for entity in range(70000)}
+    client = {}
+    net.decode_delta(net.encode_delta(0, {}, many), client)
+    _, changed, removed, _ = net.decode_delta(net.encode_delta(1, many, {}), client)
+    assert len(changed) == 0 and len(removed) == 70000 and not client
+
+
+def test_try_start_mining():
+    # ціль — найближчий досяжний добувний блок; стіни й далекі блоки не беруться
+    game.reset_game_state()
+    player = game.player
+    try:
+        x, y = player.rect.topleft
+        near = game.ColoredBlock(x + 35, y - 10, "coal.png")
+        far = game.ColoredBlock(x - 65, y - 10, "iron.png")
+        for block in (near, far):
+            game.add_block(block)
+        assert game.try_start_mining() and game.state.mining_target == near.entity
+        game.stop_mining()
+        player.rect.y -= 60
+        assert not game.try_start_mining() and game.state.mining_target is None
+    finally:
+        game.reset_game_state()
+
+
+def test_break_blocks(perf, scenario):
+    # удар по площі: 500 блоків одним пакетом (ECS, мінімапа, статичний шар, частинки)
+    targets = [(entity, block) for entity, (block, _) in game.world.query("sprite", "minable")][:500]
+
+    def unbreak():
+        game.particles.clear()
+        for _, block in targets:
+            block.is_broken = False
+            block.image = block.image_normal
+        game.world.change_many([entity for entity, _ in targets], remove=("animation",),
+                               add={"minable": [block.kind for _, block in targets]})
+    perf("break_blocks_500", measure(lambda: game.break_blocks(targets), repeat=25, setup=unbreak))
+    assert game.world.count("minable") == SCENARIO_BLOCKS - 500
+    assert 0 < len(game.particles) <= game.AREA_PARTICLES
+    # мінімапа оновлена точково, без повного перемалу
+    _, block = targets[-1]
+    assert game.minimap.base.get_at(game.minimap._to_map(block.rect)[:2])[:3] == game.minimap_color(block)
+    assert all(block.is_broken and not game.world.has(entity, "minable") for entity, block in targets)
+    assert all(game.world.has(entity, "animation") == bool(block.break_clip) for entity, block in targets)
+
+    # ланцюг: лише суміжні блоки того ж типу, кожен один раз
+    entity, (block, kind) = next(iter(game.world.query("sprite", "minable")))
+    chain = game.area_targets(block, "chain")
+    assert all(other.kind == kind and game.is_minable(other) for _, other in chain)
+    assert len({other for _, other in chain}) == len(chain) and block not in {other for _, other in chain}
+
+
+def test_atlas_staleness():
+    # PNG, змінена після збирання атласу, береться з файлу, решта — з атласу
+    if assets.load_atlas() is None:
+        pytest.skip("атлас не зібрано (build_atlas.py)")
+    path = assets.asset_path("gold.png")
+    stat = os.stat(path)
+    try:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assets.clear_cache()
+        assert assets.safe_load_image("gold.png", (50, 50)).get_parent() is None
+        assert assets.safe_load_image("coal.png", (50, 50)).get_parent() is not None
+    finally:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assets.clear_cache()
+
+
+def test_asset_reload(perf, scenario):
+    # змінений файл: картинка переписується на місці в тих самих Surface
+    name = "coal.png"
+    block = next(b for _, (b,) in game.world.query("sprite") if getattr(b, "image_path", None) == name)
+    image = block.image_normal
+    originals = {key: img.copy() for key, img in assets._image_cache.items() if key[0] == name}
+    game.camera.level = game.camera.levels.index(0.5)
+    watcher = AssetWatcher(on_reload=game.on_assets_reloaded)
+    try:
+        path = assets.asset_path(name)
+        stat = os.stat(path)
+        watcher.scan()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert watcher.scan() == [name] and watcher.apply() == 1
+
+        frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+        game.draw_game(frame)
+        assert any(key[0] is image for key in game.camera.cache.entries)
+        fresh = pygame.Surface((10, 10))
+        fresh.fill((0, 200, 0))
+        perf("asset_reload", measure(watcher.apply, number=1, setup=lambda: watcher.loaded.put((name, fresh))))
+        assert block.image_normal is image and image.get_at((25, 25))[:3] == (0, 200, 0)
+        assert not any(key[0] is image for key in game.camera.cache.entries)
+        assert game.static_layer.camera is None
+    finally:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        for key, img in originals.items():
+            assets._image_cache[key].fill((0, 0, 0, 0))
+            assets._image_cache[key].blit(img, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        game.camera.reset_zoom()
+
+
+# -------------------------------
+# Макро: цілий тік і кадр
+# -------------------------------
+def test_update_game(perf, scenario):
+    perf("update_game", measure(lambda: game.update_game(game.TICK_MS), number=5, setup=scenario))
+
+
+def test_render_frame(perf, scenario):
+    frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+    game.draw_game(frame)  # кеші шару світла тощо
+    perf("render_frame", measure(lambda: game.draw_game(frame), number=10))
+
+
+def test_render_break_finished(scenario):
+    # кадр, на якому доіграла анімація поломки, — такий самий, як повний перемал
+    frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+    game.draw_game(frame)
+    view = pygame.Rect(*game.static_layer.camera, game.WIDTH, game.HEIGHT)
+
+    def covered(block):
+        # блок, на який у статичному порядку лягає сусід (дерево нижче тощо)
+        return any(other is not block and other.bounds().colliderect(block.bounds())
+                   and game.static_order(other) > game.static_order(block)
+                   for other in game.obstacles.query_rect(block.bounds()))
+    target = next((entity, block) for entity, (block, _) in game.world.query("sprite", "minable")
+                  if block.break_clip and view.contains(block.bounds()) and covered(block))
+    game.break_blocks([target])
+    game.particles.clear()
+    game.draw_game(frame)
+    game.state.sim_time += animation.CLIPS[target[1].break_clip].duration
+    game.draw_game(frame)
+    assert not game.world.has(target[0], "animation")
+
+    reference = pygame.Surface((game.WIDTH, game.HEIGHT))
+    game.static_layer.invalidate()
+    game.draw_game(reference)
+    assert pygame.image.tobytes(frame, "RGB") == pygame.image.tobytes(reference, "RGB")
+
+
+def test_render_walk(perf, scenario):
+    # камера щокадру зсувається на player.speed: шар зсувається, малюються лише смуги
+    frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+    start = game.player.rect.center
+    steps = iter(range(10 ** 6))
+
+    def walk():
+        i = next(steps)
+        game.player.rect.center = (start[0] + game.player.speed * (i % 200), start[1])
+        game.draw_game(frame)
+    walk()
+    perf("render_walk", measure(walk, number=20))
+
+    # після всіх зсувів шар має збігатися з перемальованим з нуля
+    camera = game.static_layer.camera
+    reference = pygame.Surface((game.WIDTH, game.HEIGHT))
+    game.paint_static(reference, reference.get_rect(), *camera)
+    assert (pygame.image.tobytes(reference, "RGB")
+            == pygame.image.tobytes(game.static_layer.render(*camera), "RGB"))
+
+
+def test_render_zoomed(perf, scenario):
+    # при зумі 0.5 видно вчетверо більше; копії спрайтів будуються лише на прогріві
+    frame = pygame.Surface((game.WIDTH, game.HEIGHT))
+    cache = game.camera.cache
+    game.camera.level = game.camera.levels.index(0.5)
+    try:
+        game.draw_game(frame)
+        misses = cache.misses
+        perf("render_zoomed", measure(lambda: game.draw_game(frame), number=10))
+        assert cache.misses == misses
+    finally:
+        game.camera.reset_zoom()